@@ -7,11 +7,13 @@ as Dagster assets for orchestrating real-time data delivery and analytics.
 from dagster import AssetKey  # auto-added for hierarchical keys
 
 import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from datetime import datetime, timedelta
 
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
 from dagster import (
@@ -27,7 +29,69 @@ from dagster import (
     Model,
     MetadataValue,
 )
-from pydantic import Field
+from pydantic import Field, PrivateAttr
+
+try:
+    import re2 as _re_engine  # google-re2: linear-time matching, no backtracking
+except ImportError:
+    _re_engine = re
+
+
+# Maximum page size accepted by firehose:ListDeliveryStreams.
+_FIREHOSE_LIST_LIMIT = 10000
+
+# Sized for concurrent describe calls; botocore's default pool holds 10.
+_MAX_POOL_CONNECTIONS = 64
+
+# Worker threads used by the sensor to fan out describe calls.
+_DESCRIBE_WORKERS = 16
+
+# Perl classes and word boundaries, which RE2 matches on ASCII only while
+# ``re`` also matches non-ASCII letters, digits and spaces.
+_PERL_CLASS_RE = re.compile(r"\\[wWdDsSbB]")
+
+
+def _compile_pattern(pattern: str):
+    """Compile a user filter with RE2 when installed, else the stdlib ``re``.
+
+    Patterns using syntax RE2 does not support (backreferences, lookaround)
+    or Perl classes such as ``\\w`` (ASCII-only in RE2) use ``re`` so existing
+    filters keep matching the same names.
+    """
+    if _PERL_CLASS_RE.search(pattern):
+        return re.compile(pattern)
+    try:
+        return _re_engine.compile(pattern)
+    except _re_engine.error:
+        return re.compile(pattern)
+
+
+def _compile_matcher(pattern: Optional[str]):
+    """Return a ``search``-equivalent callable for ``pattern`` (None if unset).
+
+    A pattern that starts with ``^`` and has no alternation can only match at
+    position 0, so ``match`` is used to skip scanning the rest of the name.
+    """
+    if not pattern:
+        return None
+    compiled = _compile_pattern(pattern)
+    if pattern.startswith("^") and "|" not in pattern:
+        return compiled.match
+    return compiled.search
+
+
+def _safe_describe(
+    client: Any, name: str, operation: str, name_param: str
+) -> Tuple[str, Optional[Dict[str, Any]], Optional[ClientError]]:
+    """Call ``client.<operation>(<name_param>=name)`` and capture any ClientError.
+
+    Returns ``(name, response, error)`` so a batch of describes can run on a
+    thread pool and have failures handled by the caller in one place.
+    """
+    try:
+        return name, getattr(client, operation)(**{name_param: name}), None
+    except ClientError as e:
+        return name, None, e
 
 
 # ─── Asset overrides (inline; kept per-component to preserve self-containment) ─
@@ -149,8 +213,17 @@ class AWSKinesisComponent(Component, Model, Resolvable):
         ),
     )
 
+    _session: Optional[boto3.Session] = PrivateAttr(default=None)
+    _clients: Dict[str, Any] = PrivateAttr(default_factory=dict)
+    _const_meta: Dict[str, Dict[str, Any]] = PrivateAttr(default_factory=dict)
+    _name_filters: Optional[Tuple[Any, Any]] = PrivateAttr(default=None)
+    _required_tag_keys: Optional[Tuple[str, ...]] = PrivateAttr(default=None)
+
     def _get_boto3_session(self) -> boto3.Session:
-        """Create boto3 session with credentials."""
+        """Return the component's boto3 session, creating it on first use."""
+        if self._session is not None:
+            return self._session
+
         session_kwargs = {"region_name": self.aws_region}
 
         if self.aws_access_key_id and self.aws_secret_access_key:
@@ -160,47 +233,94 @@ class AWSKinesisComponent(Component, Model, Resolvable):
         if self.aws_session_token:
             session_kwargs["aws_session_token"] = self.aws_session_token
 
-        return boto3.Session(**session_kwargs)
+        self._session = boto3.Session(**session_kwargs)
+        return self._session
+
+    def _get_client(self, service_name: str):
+        """Return a cached client for ``service_name``.
+
+        Clients are shared by listing, every asset run and every sensor tick,
+        so their urllib3 connection pools are reused rather than rebuilt.
+        """
+        client = self._clients.get(service_name)
+        if client is None:
+            client = self._get_boto3_session().client(
+                service_name,
+                config=Config(max_pool_connections=_MAX_POOL_CONNECTIONS),
+            )
+            self._clients[service_name] = client
+        return client
+
+    def _get_name_filters(self) -> Tuple[Any, Any]:
+        """Return the (include, exclude) name matchers, compiling once."""
+        if self._name_filters is None:
+            self._name_filters = (
+                _compile_matcher(self.filter_by_name_pattern),
+                _compile_matcher(self.exclude_name_pattern),
+            )
+        return self._name_filters
+
+    def _get_required_tag_keys(self) -> Tuple[str, ...]:
+        """Return the parsed ``filter_by_tags`` keys, parsing once."""
+        if self._required_tag_keys is None:
+            self._required_tag_keys = (
+                tuple(k.strip() for k in self.filter_by_tags.split(","))
+                if self.filter_by_tags
+                else ()
+            )
+        return self._required_tag_keys
 
     def _matches_filters(self, name: str, tags: Optional[Dict[str, str]] = None) -> bool:
-        """Check if entity matches name and tag filters."""
-        # Name pattern filter
-        if self.filter_by_name_pattern:
-            if not re.search(self.filter_by_name_pattern, name):
-                return False
+        """Check if entity matches name and tag filters.
+
+        Checks run cheapest first: tag membership, then the exclusion
+        pattern, then the inclusion pattern.
+        """
+        # Tag filter
+        if tags:
+            for key in self._get_required_tag_keys():
+                if key not in tags:
+                    return False
+
+        include_match, exclude_match = self._get_name_filters()
 
         # Exclusion pattern
-        if self.exclude_name_pattern:
-            if re.search(self.exclude_name_pattern, name):
-                return False
+        if exclude_match is not None and exclude_match(name):
+            return False
 
-        # Tag filter
-        if self.filter_by_tags and tags:
-            required_keys = [k.strip() for k in self.filter_by_tags.split(",")]
-            if not all(key in tags for key in required_keys):
-                return False
+        # Name pattern filter
+        if include_match is not None and not include_match(name):
+            return False
 
         return True
 
-    def _list_firehose_streams(self, session: boto3.Session) -> List[str]:
+    def _list_firehose_streams(self) -> List[str]:
         """List all Firehose delivery streams."""
-        firehose = session.client("firehose")
+        firehose = self._get_client("firehose")
         streams = []
 
         try:
-            paginator = firehose.get_paginator("list_delivery_streams")
-            for page in paginator.paginate():
-                for stream_name in page["DeliveryStreamNames"]:
+            # Firehose has no botocore paginator. Most accounts fit in a single
+            # max-size page, so only continue when the service reports more.
+            request_kwargs: Dict[str, Any] = {"Limit": _FIREHOSE_LIST_LIMIT}
+            while True:
+                page = firehose.list_delivery_streams(**request_kwargs)
+                stream_names = page["DeliveryStreamNames"]
+                for stream_name in stream_names:
                     if self._matches_filters(stream_name):
                         streams.append(stream_name)
+
+                if not page.get("HasMoreDeliveryStreams") or not stream_names:
+                    break
+                request_kwargs["ExclusiveStartDeliveryStreamName"] = stream_names[-1]
         except ClientError as e:
             raise Exception(f"Failed to list Firehose delivery streams: {e}")
 
         return streams
 
-    def _list_analytics_applications(self, session: boto3.Session) -> List[Dict[str, Any]]:
+    def _list_analytics_applications(self) -> List[Dict[str, Any]]:
         """List all Kinesis Data Analytics applications."""
-        analytics = session.client("kinesisanalyticsv2")
+        analytics = self._get_client("kinesisanalyticsv2")
         applications = []
 
         try:
@@ -219,160 +339,156 @@ class AWSKinesisComponent(Component, Model, Resolvable):
 
         return applications
 
-    def _get_firehose_assets(self, session: boto3.Session) -> List:
-        """Generate Firehose delivery stream assets."""
-        assets = []
-        streams = self._list_firehose_streams(session)
-
-        for stream_name in streams:
-            asset_key = f"firehose_stream_{stream_name}"
-            override_deps = _resolve_override_deps(self.asset_overrides, asset_key)
-
-            @asset(
-                key=AssetKey.from_user_string(asset_key),
-                deps=override_deps,
-                group_name=self.group_name,
-                metadata={
+    def _build_firehose_asset(self, stream_name: str):
+        """Build the materializable asset for a single Firehose delivery stream."""
+        asset_key = f"firehose_stream_{stream_name}"
+        override_deps = _resolve_override_deps(self.asset_overrides, asset_key)
+
+        @asset(
+            key=AssetKey.from_user_string(asset_key),
+            deps=override_deps,
+            group_name=self.group_name,
+            metadata={
+                "stream_name": stream_name,
+                "aws_region": self.aws_region,
+            },
+        )
+        def firehose_asset(context: AssetExecutionContext):
+            """Start Firehose delivery stream data delivery."""
+            firehose = self._get_client("firehose")
+
+            # Get stream description
+            try:
+                response = firehose.describe_delivery_stream(
+                    DeliveryStreamName=stream_name
+                )
+                stream_desc = response["DeliveryStreamDescription"]
+
+                status = stream_desc["DeliveryStreamStatus"]
+                context.log.info(f"Delivery stream status: {status}")
+
+                # Get destinations
+                destinations = []
+                if "Destinations" in stream_desc:
+                    for dest in stream_desc["Destinations"]:
+                        dest_id = dest.get("DestinationId", "unknown")
+                        # Determine destination type
+                        if "S3DestinationDescription" in dest:
+                            dest_type = "S3"
+                            bucket = dest["S3DestinationDescription"]["BucketARN"]
+                            destinations.append(f"{dest_type}:{bucket}")
+                        elif "RedshiftDestinationDescription" in dest:
+                            dest_type = "Redshift"
+                            destinations.append(dest_type)
+                        elif "ElasticsearchDestinationDescription" in dest:
+                            dest_type = "Elasticsearch"
+                            destinations.append(dest_type)
+                        elif "SplunkDestinationDescription" in dest:
+                            dest_type = "Splunk"
+                            destinations.append(dest_type)
+                        elif "HttpEndpointDestinationDescription" in dest:
+                            dest_type = "HTTP Endpoint"
+                            destinations.append(dest_type)
+
+                metadata = {
                     "stream_name": stream_name,
-                    "aws_region": self.aws_region,
-                },
-            )
-            def firehose_asset(context: AssetExecutionContext, stream_name=stream_name):
-                """Start Firehose delivery stream data delivery."""
-                session = self._get_boto3_session()
-                firehose = session.client("firehose")
-
-                # Get stream description
-                try:
-                    response = firehose.describe_delivery_stream(
-                        DeliveryStreamName=stream_name
-                    )
-                    stream_desc = response["DeliveryStreamDescription"]
-
-                    status = stream_desc["DeliveryStreamStatus"]
-                    context.log.info(f"Delivery stream status: {status}")
-
-                    # Get destinations
-                    destinations = []
-                    if "Destinations" in stream_desc:
-                        for dest in stream_desc["Destinations"]:
-                            dest_id = dest.get("DestinationId", "unknown")
-                            # Determine destination type
-                            if "S3DestinationDescription" in dest:
-                                dest_type = "S3"
-                                bucket = dest["S3DestinationDescription"]["BucketARN"]
-                                destinations.append(f"{dest_type}:{bucket}")
-                            elif "RedshiftDestinationDescription" in dest:
-                                dest_type = "Redshift"
-                                destinations.append(dest_type)
-                            elif "ElasticsearchDestinationDescription" in dest:
-                                dest_type = "Elasticsearch"
-                                destinations.append(dest_type)
-                            elif "SplunkDestinationDescription" in dest:
-                                dest_type = "Splunk"
-                                destinations.append(dest_type)
-                            elif "HttpEndpointDestinationDescription" in dest:
-                                dest_type = "HTTP Endpoint"
-                                destinations.append(dest_type)
-
-                    metadata = {
-                        "stream_name": stream_name,
-                        "status": status,
-                        "destinations": ", ".join(destinations) if destinations else "None",
-                        "create_timestamp": str(stream_desc.get("CreateTimestamp", "")),
-                        "version_id": stream_desc.get("VersionId", "unknown"),
-                    }
-
-                    context.log.info(f"Firehose stream active with destinations: {destinations}")
-
-                    return metadata
-
-                except ClientError as e:
-                    context.log.error(f"Failed to describe Firehose stream: {e}")
-                    raise
-
-            assets.append(firehose_asset)
-
-        return assets
-
-    def _get_analytics_assets(self, session: boto3.Session) -> List:
-        """Generate Kinesis Data Analytics application assets."""
-        assets = []
-        applications = self._list_analytics_applications(session)
-
-        for app in applications:
-            app_name = app["name"]
-            asset_key = f"analytics_app_{app_name}"
-            override_deps = _resolve_override_deps(self.asset_overrides, asset_key)
-
-            @asset(
-                key=AssetKey.from_user_string(asset_key),
-                deps=override_deps,
-                group_name=self.group_name,
-                metadata={
-                    "application_name": app_name,
-                    "runtime": app["runtime"],
-                    "aws_region": self.aws_region,
-                },
-            )
-            def analytics_asset(context: AssetExecutionContext, app_name=app_name):
-                """Start Kinesis Data Analytics application."""
-                session = self._get_boto3_session()
-                analytics = session.client("kinesisanalyticsv2")
-
-                try:
-                    # Get application details
-                    response = analytics.describe_application(
-                        ApplicationName=app_name
+                    "status": status,
+                    "destinations": ", ".join(destinations) if destinations else "None",
+                    "create_timestamp": str(stream_desc.get("CreateTimestamp", "")),
+                    "version_id": stream_desc.get("VersionId", "unknown"),
+                }
+
+                context.log.info(f"Firehose stream active with destinations: {destinations}")
+
+                return metadata
+
+            except ClientError as e:
+                context.log.error(f"Failed to describe Firehose stream: {e}")
+                raise
+
+        return firehose_asset
+
+    def _build_analytics_asset(self, app: Dict[str, Any]):
+        """Build the materializable asset for a single Data Analytics application."""
+        app_name = app["name"]
+        asset_key = f"analytics_app_{app_name}"
+        override_deps = _resolve_override_deps(self.asset_overrides, asset_key)
+
+        @asset(
+            key=AssetKey.from_user_string(asset_key),
+            deps=override_deps,
+            group_name=self.group_name,
+            metadata={
+                "application_name": app_name,
+                "runtime": app["runtime"],
+                "aws_region": self.aws_region,
+            },
+        )
+        def analytics_asset(context: AssetExecutionContext):
+            """Start Kinesis Data Analytics application."""
+            analytics = self._get_client("kinesisanalyticsv2")
+
+            try:
+                # Get application details
+                response = analytics.describe_application(
+                    ApplicationName=app_name
+                )
+                app_detail = response["ApplicationDetail"]
+
+                status = app_detail["ApplicationStatus"]
+                context.log.info(f"Application status: {status}")
+
+                # Start application if not running
+                if status in ["READY", "STOPPING", "STOPPED"]:
+                    context.log.info(f"Starting application {app_name}...")
+
+                    # For SQL applications, we need an input starting position
+                    run_config = {}
+                    if app_detail.get("RuntimeEnvironment") == "SQL-1_0":
+                        run_config["SqlRunConfigurations"] = [{
+                            "InputId": inp["InputId"],
+                            "InputStartingPositionConfiguration": {
+                                "InputStartingPosition": "NOW"
+                            }
+                        } for inp in app_detail.get("InputDescriptions", [])]
+
+                    analytics.start_application(
+                        ApplicationName=app_name,
+                        RunConfiguration=run_config
                     )
-                    app_detail = response["ApplicationDetail"]
 
-                    status = app_detail["ApplicationStatus"]
-                    context.log.info(f"Application status: {status}")
-
-                    # Start application if not running
-                    if status in ["READY", "STOPPING", "STOPPED"]:
-                        context.log.info(f"Starting application {app_name}...")
-
-                        # For SQL applications, we need an input starting position
-                        run_config = {}
-                        if app_detail.get("RuntimeEnvironment") == "SQL-1_0":
-                            run_config["SqlRunConfigurations"] = [{
-                                "InputId": inp["InputId"],
-                                "InputStartingPositionConfiguration": {
-                                    "InputStartingPosition": "NOW"
-                                }
-                            } for inp in app_detail.get("InputDescriptions", [])]
-
-                        analytics.start_application(
-                            ApplicationName=app_name,
-                            RunConfiguration=run_config
-                        )
+                    context.log.info(f"Application {app_name} start initiated")
+                    status = "STARTING"
+                else:
+                    context.log.info(f"Application {app_name} already in {status} state")
 
-                        context.log.info(f"Application {app_name} start initiated")
-                        status = "STARTING"
-                    else:
-                        context.log.info(f"Application {app_name} already in {status} state")
+                metadata = {
+                    "application_name": app_name,
+                    "status": status,
+                    "runtime_environment": app_detail.get("RuntimeEnvironment", "UNKNOWN"),
+                    "version_id": app_detail.get("ApplicationVersionId", 0),
+                    "create_timestamp": str(app_detail.get("CreateTimestamp", "")),
+                }
 
-                    metadata = {
-                        "application_name": app_name,
-                        "status": status,
-                        "runtime_environment": app_detail.get("RuntimeEnvironment", "UNKNOWN"),
-                        "version_id": app_detail.get("ApplicationVersionId", 0),
-                        "create_timestamp": str(app_detail.get("CreateTimestamp", "")),
-                    }
+                return metadata
 
-                    return metadata
+            except ClientError as e:
+                context.log.error(f"Failed to start analytics application: {e}")
+                raise
 
-                except ClientError as e:
-                    context.log.error(f"Failed to start analytics application: {e}")
-                    raise
+        return analytics_asset
 
-            assets.append(analytics_asset)
+    def _get_firehose_assets(self) -> List:
+        """Generate Firehose delivery stream assets."""
+        streams = self._list_firehose_streams()
+        return [self._build_firehose_asset(stream_name) for stream_name in streams]
 
-        return assets
+    def _get_analytics_assets(self) -> List:
+        """Generate Kinesis Data Analytics application assets."""
+        applications = self._list_analytics_applications()
+        return [self._build_analytics_asset(app) for app in applications]
 
-    def _get_observation_sensor(self, session: boto3.Session):
+    def _get_observation_sensor(self):
         """Generate sensor to observe Kinesis resources."""
 
         @sensor(
@@ -390,64 +506,78 @@ class AWSKinesisComponent(Component, Model, Resolvable):
                 last_check = datetime.utcnow() - timedelta(hours=1)
 
             now = datetime.utcnow()
+            # Immutable, so one instance is shared by every event this tick.
+            observed_at = MetadataValue.text(now.isoformat())
 
             # Observe Firehose streams
             if self.import_firehose_streams:
-                firehose = session.client("firehose")
-                streams = self._list_firehose_streams(session)
-
-                for stream_name in streams:
-                    try:
-                        response = firehose.describe_delivery_stream(
-                            DeliveryStreamName=stream_name
+                firehose = self._get_client("firehose")
+                streams = self._list_firehose_streams()
+
+                with ThreadPoolExecutor(max_workers=_DESCRIBE_WORKERS) as pool:
+                    described = list(pool.map(
+                        lambda name: _safe_describe(
+                            firehose, name, "describe_delivery_stream", "DeliveryStreamName"
+                        ),
+                        streams,
+                    ))
+
+                for stream_name, response, err in described:
+                    if err is not None:
+                        context.log.warning(f"Failed to describe stream {stream_name}: {err}")
+                        continue
+
+                    status = response["DeliveryStreamDescription"]["DeliveryStreamStatus"]
+
+                    if status == "ACTIVE":
+                        asset_key = f"firehose_stream_{stream_name}"
+                        const_meta = self._const_meta.get(asset_key)
+                        if const_meta is None:
+                            const_meta = self._const_meta[asset_key] = {
+                                "stream_name": MetadataValue.text(stream_name),
+                                "status": MetadataValue.text(status),
+                            }
+
+                        yield AssetMaterialization(
+                            asset_key=asset_key,
+                            metadata={**const_meta, "observed_at": observed_at},
                         )
-                        stream_desc = response["DeliveryStreamDescription"]
-
-                        status = stream_desc["DeliveryStreamStatus"]
-
-                        if status == "ACTIVE":
-                            asset_key = f"firehose_stream_{stream_name}"
-
-                            yield AssetMaterialization(
-                                asset_key=asset_key,
-                                metadata={
-                                    "stream_name": MetadataValue.text(stream_name),
-                                    "status": MetadataValue.text(status),
-                                    "observed_at": MetadataValue.text(now.isoformat()),
-                                },
-                            )
-                    except ClientError as e:
-                        context.log.warning(f"Failed to describe stream {stream_name}: {e}")
 
             # Observe Analytics applications
             if self.import_analytics_applications:
-                analytics = session.client("kinesisanalyticsv2")
-                applications = self._list_analytics_applications(session)
-
-                for app in applications:
-                    app_name = app["name"]
-                    try:
-                        response = analytics.describe_application(
-                            ApplicationName=app_name
-                        )
-                        app_detail = response["ApplicationDetail"]
+                analytics = self._get_client("kinesisanalyticsv2")
+                applications = self._list_analytics_applications()
+
+                with ThreadPoolExecutor(max_workers=_DESCRIBE_WORKERS) as pool:
+                    described = list(pool.map(
+                        lambda name: _safe_describe(
+                            analytics, name, "describe_application", "ApplicationName"
+                        ),
+                        [app["name"] for app in applications],
+                    ))
+
+                for app_name, response, err in described:
+                    if err is not None:
+                        context.log.warning(f"Failed to describe application {app_name}: {err}")
+                        continue
 
-                        status = app_detail["ApplicationStatus"]
-
-                        if status == "RUNNING":
-                            asset_key = f"analytics_app_{app_name}"
+                    app_detail = response["ApplicationDetail"]
+                    status = app_detail["ApplicationStatus"]
 
-                            yield AssetMaterialization(
-                                asset_key=asset_key,
-                                metadata={
-                                    "application_name": MetadataValue.text(app_name),
-                                    "status": MetadataValue.text(status),
-                                    "runtime": MetadataValue.text(app_detail.get("RuntimeEnvironment", "UNKNOWN")),
-                                    "observed_at": MetadataValue.text(now.isoformat()),
-                                },
-                            )
-                    except ClientError as e:
-                        context.log.warning(f"Failed to describe application {app_name}: {e}")
+                    if status == "RUNNING":
+                        asset_key = f"analytics_app_{app_name}"
+                        const_meta = self._const_meta.get(asset_key)
+                        if const_meta is None:
+                            const_meta = self._const_meta[asset_key] = {
+                                "application_name": MetadataValue.text(app_name),
+                                "status": MetadataValue.text(status),
+                                "runtime": MetadataValue.text(app_detail.get("RuntimeEnvironment", "UNKNOWN")),
+                            }
+
+                        yield AssetMaterialization(
+                            asset_key=asset_key,
+                            metadata={**const_meta, "observed_at": observed_at},
+                        )
 
             # Update cursor
             context.update_cursor(now.isoformat())
@@ -456,22 +586,20 @@ class AWSKinesisComponent(Component, Model, Resolvable):
 
     def build_defs(self, context: ComponentLoadContext) -> Definitions:
         """Build Dagster definitions from this component."""
-        session = self._get_boto3_session()
-
         assets = []
         sensors = []
 
         # Import Firehose delivery streams
         if self.import_firehose_streams:
-            assets.extend(self._get_firehose_assets(session))
+            assets.extend(self._get_firehose_assets())
 
         # Import Data Analytics applications
         if self.import_analytics_applications:
-            assets.extend(self._get_analytics_assets(session))
+            assets.extend(self._get_analytics_assets())
 
         # Generate observation sensor
         if self.generate_sensor and (self.import_firehose_streams or self.import_analytics_applications):
-            sensors.append(self._get_observation_sensor(session))
+            sensors.append(self._get_observation_sensor())
 
         return Definitions(
             assets=assets,
@@ -6,12 +6,19 @@ as Dagster assets for orchestrating data warehouse operations.
 
 from dagster import AssetKey  # auto-added for hierarchical keys
 
+import json
+import logging
+import random
 import re
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Optional, List, Dict, Any
+from itertools import chain
+from pathlib import Path
+from typing import Optional, List, Dict, Any, Callable, Iterator, Set, Tuple, Union
 
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
 from dagster import (
@@ -19,11 +26,147 @@ from dagster import (
     ComponentLoadContext,
     Definitions,
     AssetExecutionContext,
-    asset,
+    AssetSpec,
+    MaterializeResult,
+    multi_asset,
     Resolvable,
     Model,
 )
-from pydantic import Field
+from pydantic import Field, PrivateAttr
+
+_logger = logging.getLogger(__name__)
+
+# Data API statement states after which describe_statement stops changing.
+_TERMINAL_STATUSES = ("FINISHED", "FAILED", "ABORTED")
+
+# Filter patterns made only of these characters (plus ^/$ anchors) mean the
+# same thing to Python's re and Redshift's POSIX regex operators, so they are
+# evaluated server-side.
+_PUSHDOWN_PATTERN_RE = re.compile(r"^\^?[A-Za-z0-9_-]+\$?$")
+
+# redshift-data connection pool size; also caps concurrent statements per step.
+_MAX_POOL_CONNECTIONS = 32
+
+# CALL / REFRESH take identifiers, which the Data API cannot bind as parameters.
+_SQL_IDENTIFIER_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+# Characters Dagster does not allow in op names.
+_INVALID_OP_NAME_CHARS_RE = re.compile(r"[^A-Za-z0-9_]")
+
+# describe_statement polling backoff bounds, in seconds.
+_POLL_INITIAL_DELAY = 0.1
+_POLL_MAX_DELAY = 5.0
+
+
+def _record_name(record: List[Dict[str, Any]]) -> Optional[str]:
+    """Return the first column of a Data API record if it is a string."""
+    return record[0].get("stringValue") if record else None
+
+
+def _iter_statement_names(redshift_data: Any, statement_id: str) -> Iterator[str]:
+    """Yield the first-column string of every result row, one page at a time.
+
+    The Data API pages result sets; only the current page is held in memory.
+    """
+    pages = redshift_data.get_paginator("get_statement_result").paginate(Id=statement_id)
+    records = chain.from_iterable(page.get("Records", ()) for page in pages)
+    return filter(None, map(_record_name, records))
+
+
+def _require_identifiers(*names: str) -> None:
+    """Raise if any name is not a plain identifier that is safe to interpolate."""
+    for name in names:
+        if not _SQL_IDENTIFIER_RE.match(name):
+            raise ValueError(f"Refusing to interpolate unsafe SQL identifier: {name!r}")
+
+
+def _wait_for_statement(
+    redshift_data: Any,
+    statement_id: str,
+    max_wait: float,
+    return_on_result_set: bool = False,
+) -> Dict[str, Any]:
+    """Poll ``describe_statement`` until the statement ends or ``max_wait`` elapses.
+
+    Polls back off exponentially (100ms doubling up to 5s, plus up to 10%
+    jitter) so short statements are noticed almost immediately while long
+    ones don't flood the Data API. Returns the last ``describe_statement``
+    response; its ``Status`` is non-terminal if the wait timed out, or if
+    ``return_on_result_set`` is set and the statement already reports
+    ``HasResultSet``.
+
+    This is deliberately not a botocore waiter: ``redshift-data`` defines no
+    waiters, and custom ``WaiterModel`` waiters poll at a fixed delay while
+    issuing the same ``describe_statement`` calls.
+    """
+    deadline = time.monotonic() + max_wait
+    delay = _POLL_INITIAL_DELAY
+
+    while True:
+        describe_response = redshift_data.describe_statement(Id=statement_id)
+        if describe_response["Status"] in _TERMINAL_STATUSES:
+            return describe_response
+        if return_on_result_set and describe_response.get("HasResultSet"):
+            return describe_response
+
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return describe_response
+
+        time.sleep(min(delay + random.uniform(0, delay * 0.1), remaining))
+        delay = min(delay * 2, _POLL_MAX_DELAY)
+
+
+# ─── Catalog cache ────────────────────────────────────────────────────────────
+#
+# Listing pg_proc / pg_matviews costs a Data API round trip plus Redshift
+# planner time on every component load, while the catalog rarely changes.
+# Results are kept in-process and mirrored to a JSON file so fresh code-server
+# processes can reuse them too. Entries are (fetched_at, procedures, views),
+# keyed by everything that shapes the catalog query.
+
+_CATALOG_CACHE: Dict[str, Tuple[float, List[str], List[str]]] = {}
+_CATALOG_CACHE_PATH = Path.home() / ".cache" / "dagster_redshift_catalog.json"
+
+
+def _read_catalog_cache_file() -> Dict[str, Any]:
+    try:
+        return json.loads(_CATALOG_CACHE_PATH.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def _get_cached_catalog(key: str, ttl: int) -> Optional[Tuple[List[str], List[str]]]:
+    """Return the cached ``(procedures, views)`` for ``key`` if younger than ``ttl``."""
+    entry = _CATALOG_CACHE.get(key)
+    if entry is None:
+        disk_entry = _read_catalog_cache_file().get(key)
+        if disk_entry:
+            entry = _CATALOG_CACHE[key] = (disk_entry[0], disk_entry[1], disk_entry[2])
+    if entry is None or time.time() - entry[0] >= ttl:
+        return None
+    return entry[1], entry[2]
+
+
+def _set_cached_catalog(key: str, procedures: List[str], views: List[str]) -> None:
+    _CATALOG_CACHE[key] = (time.time(), procedures, views)
+    disk_cache = _read_catalog_cache_file()
+    disk_cache[key] = list(_CATALOG_CACHE[key])
+    try:
+        _CATALOG_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        _CATALOG_CACHE_PATH.write_text(json.dumps(disk_cache))
+    except OSError:
+        pass
+
+
+def _invalidate_cached_catalog(key: str) -> None:
+    _CATALOG_CACHE.pop(key, None)
+    disk_cache = _read_catalog_cache_file()
+    if disk_cache.pop(key, None) is not None:
+        try:
+            _CATALOG_CACHE_PATH.write_text(json.dumps(disk_cache))
+        except OSError:
+            pass
 
 
 # ─── Asset overrides (inline; kept per-component to preserve self-containment) ─
@@ -52,6 +195,146 @@ def _resolve_override_deps(
     return [AssetKey(d.split("/")) if "/" in d else AssetKey(d) for d in ov.depends_on]
 
 
+def _dependency_waves(keys: List[AssetKey], upstream_by_key: Dict[AssetKey, Set[AssetKey]]) -> List[List[AssetKey]]:
+    """Group ``keys`` into waves so each key runs after its upstreams in ``keys``."""
+    remaining = set(keys)
+    waves = []
+    while remaining:
+        wave = [key for key in keys if key in remaining and not (upstream_by_key[key] & remaining)]
+        if not wave:
+            # Dependency cycle among the selected keys; run the rest together.
+            wave = [key for key in keys if key in remaining]
+        waves.append(wave)
+        remaining.difference_update(wave)
+    return waves
+
+
+def _op_name(component: "AWSRedshiftComponent", suffix: str) -> str:
+    """Build an op name unique to the component's group, cluster, database and schema.
+
+    Several Redshift components can share a group, so the group name alone
+    would give their multi-assets conflicting op names.
+    """
+    scope = "_".join(
+        [component.group_name, component.cluster_identifier, component.database, component.schema_name or ""]
+    )
+    return f"{_INVALID_OP_NAME_CHARS_RE.sub('_', scope)}_{suffix}"
+
+
+def _make_statement_multi_asset(
+    component: "AWSRedshiftComponent",
+    op_name: str,
+    entities: Dict[str, Tuple[str, Dict[str, Any]]],
+    build_sql: Callable[[str], str],
+    log_label: str,
+):
+    """Build one subsettable asset that runs a SQL statement per selected entity.
+
+    ``entities`` maps each asset key to ``(entity_name, metadata)``. All asset
+    specs are declared by a single decorator, so definition cost no longer
+    grows with one ``@asset`` per entity. At run time the selected entities'
+    statements are submitted together and waited on in parallel; entities
+    that depend on other selected entities (via ``asset_overrides``) run in a
+    later wave, and waves after a failure are skipped.
+    """
+    specs = []
+    entity_by_key: Dict[AssetKey, Tuple[str, Dict[str, Any]]] = {}
+    upstream_by_key: Dict[AssetKey, Set[AssetKey]] = {}
+
+    for asset_key, (entity_name, metadata) in entities.items():
+        key = AssetKey.from_user_string(asset_key)
+        deps = _resolve_override_deps(component.asset_overrides, asset_key)
+        entity_by_key[key] = (entity_name, metadata)
+        upstream_by_key[key] = set(deps)
+        specs.append(AssetSpec(
+            key=key,
+            deps=deps,
+            group_name=component.group_name,
+            metadata=metadata,
+        ))
+
+    @multi_asset(name=op_name, specs=specs, can_subset=True)
+    def statement_assets(context: AssetExecutionContext):
+        session = component._get_boto3_session()
+        selected = [key for key in entity_by_key if key in context.selected_asset_keys]
+
+        def run(key: AssetKey) -> Tuple[Optional[Dict[str, Any]], Optional[Exception]]:
+            entity_name, _ = entity_by_key[key]
+            try:
+                sql = build_sql(entity_name)
+                context.log.info(f"{log_label}: {sql}")
+                return component._execute_sql(session, sql, context), None
+            except Exception as e:
+                return None, e
+
+        failures = []
+        with ThreadPoolExecutor(max_workers=min(len(selected), _MAX_POOL_CONNECTIONS)) as pool:
+            for wave in _dependency_waves(selected, upstream_by_key):
+                if failures:
+                    failures.extend(f"{entity_by_key[key][0]}: skipped" for key in wave)
+                    continue
+                for key, (result, error) in zip(wave, pool.map(run, wave)):
+                    entity_name, metadata = entity_by_key[key]
+                    if error is not None:
+                        failures.append(f"{entity_name}: {error}")
+                        continue
+                    yield MaterializeResult(asset_key=key, metadata={**metadata, **result})
+
+        if failures:
+            raise Exception(f"{log_label} failed: {'; '.join(failures)}")
+
+    return statement_assets
+
+
+def _make_procedure_multi_asset(component: "AWSRedshiftComponent", procedures: List[str]):
+    """Build the asset that CALLs the selected Redshift stored procedures."""
+    schema_name = component.schema_name
+
+    def build_sql(proc_name: str) -> str:
+        _require_identifiers(schema_name, proc_name)
+        return f"CALL {schema_name}.{proc_name}();"
+
+    return _make_statement_multi_asset(
+        component,
+        op_name=_op_name(component, "call_stored_procedures"),
+        entities={
+            f"procedure_{proc_name}": (proc_name, {
+                "procedure_name": proc_name,
+                "schema": schema_name,
+                "cluster": component.cluster_identifier,
+            })
+            for proc_name in procedures
+        },
+        build_sql=build_sql,
+        log_label="Executing stored procedure",
+    )
+
+
+def _make_matview_multi_asset(component: "AWSRedshiftComponent", views: List[str]):
+    """Build the asset that refreshes the selected Redshift materialized views."""
+    schema_name = component.schema_name
+
+    def build_sql(view_name: str) -> str:
+        _require_identifiers(*view_name.split("."))
+        return f"REFRESH MATERIALIZED VIEW {view_name};"
+
+    return _make_statement_multi_asset(
+        component,
+        op_name=_op_name(component, "refresh_materialized_views"),
+        entities={
+            # Key on just the view name without schema
+            f"matview_{view_name.split('.')[-1]}": (view_name, {
+                "view_name": view_name,
+                "schema": schema_name,
+                "cluster": component.cluster_identifier,
+            })
+            for view_name in views
+        },
+        build_sql=build_sql,
+        log_label="Refreshing materialized view",
+    )
+
+
 class AWSRedshiftComponent(Component, Model, Resolvable):
     """Component for importing AWS Redshift entities as Dagster assets.
 
@@ -141,6 +424,16 @@ class AWSRedshiftComponent(Component, Model, Resolvable):
         description="Schema name to query for procedures and views"
     )
 
+    fast_return: bool = Field(
+        default=False,
+        description="Finish CALL / REFRESH assets as soon as the Data API reports a result set, without waiting for the final FINISHED status"
+    )
+
+    catalog_cache_ttl: int = Field(
+        default=300,
+        description="Seconds to reuse the stored procedure / materialized view listing across component loads (0 disables caching)"
+    )
+
     group_name: str = Field(
         default="aws_redshift",
         description="Asset group name for all imported assets"
@@ -161,8 +454,27 @@ class AWSRedshiftComponent(Component, Model, Resolvable):
         ),
     )
 
+    _filter_re: Optional[re.Pattern] = PrivateAttr(default=None)
+    _exclude_re: Optional[re.Pattern] = PrivateAttr(default=None)
+    _session: Optional[boto3.Session] = PrivateAttr(default=None)
+    _redshift_data_client: Optional[Any] = PrivateAttr(default=None)
+    _account_id: Optional[str] = PrivateAttr(default=None)
+
+    def model_post_init(self, __context: Any) -> None:
+        """Compile the name filter patterns once per component instance."""
+        self._filter_re = re.compile(self.filter_by_name_pattern) if self.filter_by_name_pattern else None
+        self._exclude_re = re.compile(self.exclude_name_pattern) if self.exclude_name_pattern else None
+
     def _get_boto3_session(self) -> boto3.Session:
-        """Create boto3 session with credentials."""
+        """Return the component's boto3 session, creating it on first use.
+
+        Credentials resolved through the default provider chain (instance
+        profiles, assumed roles) are refreshable, so the shared session stays
+        valid for the life of the process.
+        """
+        if self._session is not None:
+            return self._session
+
         session_kwargs = {"region_name": self.aws_region}
 
         if self.aws_access_key_id and self.aws_secret_access_key:
@@ -172,78 +484,115 @@ class AWSRedshiftComponent(Component, Model, Resolvable):
         if self.aws_session_token:
             session_kwargs["aws_session_token"] = self.aws_session_token
 
-        return boto3.Session(**session_kwargs)
+        self._session = boto3.Session(**session_kwargs)
+        return self._session
+
+    def _get_account_id(self) -> str:
+        """Return the AWS account the component's credentials belong to.
+
+        Looked up once through STS, so the catalog cache can tell apart
+        clusters with the same identifier in different accounts.
+        """
+        if self._account_id is None:
+            self._account_id = self._get_boto3_session().client("sts").get_caller_identity()["Account"]
+        return self._account_id
+
+    def _get_client(self, session: boto3.Session):
+        """Return the component's ``redshift-data`` client, creating it on first use.
+
+        Building a client loads the service model and sets up SSL state, so one
+        client is shared by listing and every asset execution.
+        """
+        if self._redshift_data_client is None:
+            self._redshift_data_client = session.client(
+                "redshift-data",
+                config=Config(
+                    max_pool_connections=_MAX_POOL_CONNECTIONS,
+                    retries={"mode": "adaptive", "max_attempts": 5},
+                    tcp_keepalive=True,
+                    connect_timeout=5,
+                    read_timeout=30,
+                ),
+            )
+        return self._redshift_data_client
 
     def _matches_filters(self, name: str) -> bool:
         """Check if entity matches name filters."""
         # Name pattern filter
-        if self.filter_by_name_pattern:
-            if not re.search(self.filter_by_name_pattern, name):
-                return False
+        if self._filter_re is not None and not self._filter_re.search(name):
+            return False
 
         # Exclusion pattern
-        if self.exclude_name_pattern:
-            if re.search(self.exclude_name_pattern, name):
-                return False
+        if self._exclude_re is not None and self._exclude_re.search(name):
+            return False
 
         return True
 
-    def _execute_sql(self, session: boto3.Session, sql: str, context: AssetExecutionContext) -> Dict[str, Any]:
-        """Execute SQL statement using Redshift Data API."""
-        redshift_data = session.client("redshift-data")
+    def _statement_params(
+        self, sql: Union[str, List[str]], parameters: Optional[List[Dict[str, str]]] = None
+    ) -> Dict[str, Any]:
+        """Build Data API arguments for ``sql`` on the configured cluster.
 
-        # Build execution parameters
-        exec_params = {
+        A list of statements produces ``batch_execute_statement`` arguments.
+        """
+        exec_params: Dict[str, Any] = {
             "ClusterIdentifier": self.cluster_identifier,
             "Database": self.database,
-            "Sql": sql,
         }
+        exec_params["Sqls" if isinstance(sql, list) else "Sql"] = sql
+
+        if parameters:
+            exec_params["Parameters"] = parameters
 
         if self.secret_arn:
             exec_params["SecretArn"] = self.secret_arn
         elif self.db_user:
             exec_params["DbUser"] = self.db_user
 
+        return exec_params
+
+    def _execute_sql(self, session: boto3.Session, sql: str, context: AssetExecutionContext) -> Dict[str, Any]:
+        """Execute SQL statement using Redshift Data API."""
+        redshift_data = self._get_client(session)
+
         try:
             # Execute statement
-            response = redshift_data.execute_statement(**exec_params)
+            response = redshift_data.execute_statement(**self._statement_params(sql))
             statement_id = response["Id"]
 
             context.log.info(f"Statement execution started: {statement_id}")
 
             # Wait for completion (max 10 minutes)
             max_wait = 600
-            poll_interval = 2
-            elapsed = 0
-
-            while elapsed < max_wait:
-                describe_response = redshift_data.describe_statement(Id=statement_id)
-                status = describe_response["Status"]
-
-                if status == "FINISHED":
-                    context.log.info("Statement execution completed successfully")
-
-                    # Get result metadata
-                    result_metadata = {
-                        "statement_id": statement_id,
-                        "status": status,
-                        "duration_ms": describe_response.get("Duration", 0) / 1000000,  # Convert to ms
-                        "rows_affected": describe_response.get("ResultRows", 0),
-                    }
-
-                    return result_metadata
+            fast_return = self.fast_return and sql.lstrip().upper().startswith(("REFRESH", "CALL"))
+            describe_response = _wait_for_statement(
+                redshift_data, statement_id, max_wait, return_on_result_set=fast_return
+            )
+            status = describe_response["Status"]
+
+            if status == "FINISHED" or (
+                fast_return and status not in _TERMINAL_STATUSES and describe_response.get("HasResultSet")
+            ):
+                context.log.info("Statement execution completed successfully")
+
+                # Get result metadata
+                result_metadata = {
+                    "statement_id": statement_id,
+                    "status": status,
+                    "duration_ms": describe_response.get("Duration", 0) / 1000000,  # Convert to ms
+                    "rows_affected": describe_response.get("ResultRows", 0),
+                }
 
-                elif status == "FAILED":
-                    error = describe_response.get("Error", "Unknown error")
-                    context.log.error(f"Statement execution failed: {error}")
-                    raise Exception(f"SQL execution failed: {error}")
+                return result_metadata
 
-                elif status == "ABORTED":
-                    context.log.error("Statement execution was aborted")
-                    raise Exception("SQL execution was aborted")
+            elif status == "FAILED":
+                error = describe_response.get("Error", "Unknown error")
+                context.log.error(f"Statement execution failed: {error}")
+                raise Exception(f"SQL execution failed: {error}")
 
-                time.sleep(poll_interval)
-                elapsed += poll_interval
+            elif status == "ABORTED":
+                context.log.error("Statement execution was aborted")
+                raise Exception("SQL execution was aborted")
 
             context.log.warning(f"Statement execution timed out after {max_wait} seconds")
             return {
@@ -255,211 +604,220 @@ class AWSRedshiftComponent(Component, Model, Resolvable):
             context.log.error(f"Failed to execute SQL: {e}")
             raise
 
-    def _list_stored_procedures(self, session: boto3.Session) -> List[str]:
-        """List stored procedures in the schema."""
-        redshift_data = session.client("redshift-data")
-
-        sql = f"""
-        SELECT proname
-        FROM pg_proc
-        JOIN pg_namespace ON pg_proc.pronamespace = pg_namespace.oid
-        WHERE pg_namespace.nspname = '{self.schema_name}'
-        AND prokind = 'p'
-        ORDER BY proname;
-        """
+    def _filters_exclude_everything(self) -> bool:
+        """True when the name filters provably reject every possible name.
 
-        exec_params = {
-            "ClusterIdentifier": self.cluster_identifier,
-            "Database": self.database,
-            "Sql": sql,
-        }
-
-        if self.secret_arn:
-            exec_params["SecretArn"] = self.secret_arn
-        elif self.db_user:
-            exec_params["DbUser"] = self.db_user
+        Only decidable for literal patterns: if the inclusion text contains
+        the exclusion text, any name matching the former also matches the
+        latter.
+        """
+        include, exclude = self.filter_by_name_pattern, self.exclude_name_pattern
+        if not include or not exclude:
+            return False
+        if re.escape(include) != include or re.escape(exclude) != exclude:
+            return False
+        return exclude in include
+
+    def _list_catalog(self) -> Tuple[List[str], List[str]]:
+        """List stored procedures and materialized views, reusing a cached listing.
+
+        Returns ``(procedures, views)``. Listings younger than
+        ``catalog_cache_ttl`` seconds are served without touching Redshift.
+        The cache file is shared by every process using this home directory,
+        so entries are keyed by account, region and database user as well as
+        the query inputs.
+        """
+        if self.catalog_cache_ttl <= 0:
+            return self._fetch_catalog()
+
+        cache_key = json.dumps([
+            self._get_account_id(),
+            self.aws_region,
+            self.secret_arn,
+            self.db_user,
+            self.cluster_identifier,
+            self.database,
+            self.schema_name,
+            self.import_stored_procedures,
+            self.import_materialized_views,
+            self.filter_by_name_pattern,
+            self.exclude_name_pattern,
+        ])
+        cached = _get_cached_catalog(cache_key, self.catalog_cache_ttl)
+        if cached is not None:
+            return cached
 
         try:
-            response = redshift_data.execute_statement(**exec_params)
-            statement_id = response["Id"]
-
-            # Wait for completion
-            max_wait = 30
-            elapsed = 0
-            while elapsed < max_wait:
-                describe_response = redshift_data.describe_statement(Id=statement_id)
-                if describe_response["Status"] == "FINISHED":
-                    break
-                time.sleep(1)
-                elapsed += 1
-
-            # Get results
-            result_response = redshift_data.get_statement_result(Id=statement_id)
-            procedures = []
-
-            for record in result_response.get("Records", []):
-                proc_name = record[0].get("stringValue", "")
-                if proc_name and self._matches_filters(proc_name):
-                    procedures.append(proc_name)
-
-            return procedures
+            procedures, views = self._fetch_catalog()
+        except Exception:
+            _invalidate_cached_catalog(cache_key)
+            raise
 
-        except ClientError as e:
-            raise Exception(f"Failed to list stored procedures: {e}")
+        _set_cached_catalog(cache_key, procedures, views)
+        return procedures, views
 
-    def _list_materialized_views(self, session: boto3.Session) -> List[str]:
-        """List materialized views in the schema."""
-        redshift_data = session.client("redshift-data")
+    def _name_filter_sql(self) -> Tuple[str, List[Dict[str, str]], bool]:
+        """Build SQL predicates for the name filters Redshift can evaluate.
 
-        sql = f"""
-        SELECT schemaname || '.' || matviewname as full_name
-        FROM pg_matviews
-        WHERE schemaname = '{self.schema_name}'
-        ORDER BY matviewname;
+        Returns a template with a ``{column}`` placeholder, the Data API
+        parameters it binds, and whether every configured filter was pushed
+        down. Patterns using other regex syntax are left to
+        ``_matches_filters``, since Python and POSIX regex differ.
         """
+        clauses = []
+        parameters = []
+        all_pushed_down = True
+
+        for param_name, pattern, operator in (
+            ("include_pattern", self.filter_by_name_pattern, "~"),
+            ("exclude_pattern", self.exclude_name_pattern, "!~"),
+        ):
+            if not pattern:
+                continue
+            if _PUSHDOWN_PATTERN_RE.match(pattern):
+                clauses.append(f"AND {{column}} {operator} :{param_name}")
+                parameters.append({"name": param_name, "value": pattern})
+            else:
+                all_pushed_down = False
+
+        return " ".join(clauses), parameters, all_pushed_down
+
+    def _fetch_catalog(self) -> Tuple[List[str], List[str]]:
+        """Query the schema's stored procedures and materialized views.
+
+        The enabled catalog queries are submitted as one parameterized
+        ``batch_execute_statement`` so they share a single wait loop; each
+        sub-statement's rows are then read back concurrently. Returns
+        ``(procedures, views)``.
+        """
+        redshift_data = self._get_client(self._get_boto3_session())
+        name_filter_sql, parameters, filters_pushed_down = self._name_filter_sql()
+        parameters = [{"name": "schema_name", "value": self.schema_name}, *parameters]
 
-        exec_params = {
-            "ClusterIdentifier": self.cluster_identifier,
-            "Database": self.database,
-            "Sql": sql,
-        }
-
-        if self.secret_arn:
-            exec_params["SecretArn"] = self.secret_arn
-        elif self.db_user:
-            exec_params["DbUser"] = self.db_user
+        queries = []
+        if self.import_stored_procedures:
+            queries.append(("procedures", f"""
+            SELECT proname
+            FROM pg_proc
+            JOIN pg_namespace ON pg_proc.pronamespace = pg_namespace.oid
+            WHERE pg_namespace.nspname = :schema_name
+            AND prokind = 'p'
+            {name_filter_sql.format(column="proname")}
+            ORDER BY proname;
+            """))
+        if self.import_materialized_views:
+            queries.append(("views", f"""
+            SELECT schemaname || '.' || matviewname as full_name
+            FROM pg_matviews
+            WHERE schemaname = :schema_name
+            {name_filter_sql.format(column="schemaname || '.' || matviewname")}
+            ORDER BY matviewname;
+            """))
+
+        catalog: Dict[str, List[str]] = {"procedures": [], "views": []}
+        if not queries:
+            return catalog["procedures"], catalog["views"]
+
+        # Procedures and views often share naming schemes, so a name is only
+        # matched against the patterns once per listing.
+        name_cache: Dict[str, bool] = {}
+
+        def matches(name: str) -> bool:
+            if (hit := name_cache.get(name)) is None:
+                hit = self._matches_filters(name)
+                name_cache[name] = hit
+            return hit
+
+        def read_names(sub_statement_id: str) -> List[str]:
+            # Get results, filtering as pages stream in
+            names = _iter_statement_names(redshift_data, sub_statement_id)
+            if filters_pushed_down:
+                return list(names)
+            return [name for name in names if matches(name)]
 
         try:
-            response = redshift_data.execute_statement(**exec_params)
+            response = redshift_data.batch_execute_statement(
+                **self._statement_params([sql for _, sql in queries], parameters)
+            )
             statement_id = response["Id"]
 
-            # Wait for completion
+            # Results can only be read once the statement has FINISHED
             max_wait = 30
-            elapsed = 0
-            while elapsed < max_wait:
-                describe_response = redshift_data.describe_statement(Id=statement_id)
-                if describe_response["Status"] == "FINISHED":
-                    break
-                time.sleep(1)
-                elapsed += 1
-
-            # Get results
-            result_response = redshift_data.get_statement_result(Id=statement_id)
-            views = []
-
-            for record in result_response.get("Records", []):
-                view_name = record[0].get("stringValue", "")
-                if view_name and self._matches_filters(view_name):
-                    views.append(view_name)
-
-            return views
+            describe_response = _wait_for_statement(redshift_data, statement_id, max_wait)
+            status = describe_response["Status"]
+            if status in ("FAILED", "ABORTED"):
+                error = describe_response.get("Error", status)
+                raise Exception(f"Failed to list Redshift catalog: {error}")
+            if status != "FINISHED":
+                raise Exception(
+                    f"Failed to list Redshift catalog: statement {statement_id} still "
+                    f"{status} after {max_wait} seconds"
+                )
+
+            # Sub-statements come back in submission order
+            sub_statement_ids = [sub["Id"] for sub in describe_response.get("SubStatements", [])]
+            with ThreadPoolExecutor(max_workers=len(queries)) as pool:
+                results = list(pool.map(read_names, sub_statement_ids))
+
+            for (kind, _), names in zip(queries, results):
+                catalog[kind] = names
 
         except ClientError as e:
-            raise Exception(f"Failed to list materialized views: {e}")
+            raise Exception(f"Failed to list Redshift catalog: {e}")
 
-    def _get_scheduled_query_assets(self, session: boto3.Session) -> List:
+        return catalog["procedures"], catalog["views"]
+
+    def _get_scheduled_query_assets(self) -> List:
         """Generate scheduled query assets."""
         # Note: Redshift scheduled queries are managed via EventBridge Scheduler
         # This is a placeholder - implementation would require EventBridge integration
         return []
 
-    def _get_stored_procedure_assets(self, session: boto3.Session) -> List:
+    def _get_stored_procedure_assets(self, procedures: List[str]) -> List:
         """Generate stored procedure assets."""
-        assets = []
-        procedures = self._list_stored_procedures(session)
-
-        for proc_name in procedures:
-            asset_key = f"procedure_{proc_name}"
-            override_deps = _resolve_override_deps(self.asset_overrides, asset_key)
-
-            @asset(
-                key=AssetKey.from_user_string(asset_key),
-                deps=override_deps,
-                group_name=self.group_name,
-                metadata={
-                    "procedure_name": proc_name,
-                    "schema": self.schema_name,
-                    "cluster": self.cluster_identifier,
-                },
-            )
-            def procedure_asset(context: AssetExecutionContext, proc_name=proc_name):
-                """Execute Redshift stored procedure."""
-                session = self._get_boto3_session()
-
-                # Call stored procedure
-                sql = f"CALL {self.schema_name}.{proc_name}();"
-                context.log.info(f"Executing stored procedure: {sql}")
-
-                result = self._execute_sql(session, sql, context)
-
-                return {
-                    "procedure_name": proc_name,
-                    "schema": self.schema_name,
-                    **result,
-                }
+        if not procedures:
+            return []
+        return [_make_procedure_multi_asset(self, procedures)]
 
-            assets.append(procedure_asset)
-
-        return assets
-
-    def _get_materialized_view_assets(self, session: boto3.Session) -> List:
+    def _get_materialized_view_assets(self, views: List[str]) -> List:
         """Generate materialized view assets."""
-        assets = []
-        views = self._list_materialized_views(session)
-
-        for view_name in views:
-            # Extract just the view name without schema
-            simple_name = view_name.split('.')[-1]
-            asset_key = f"matview_{simple_name}"
-            override_deps = _resolve_override_deps(self.asset_overrides, asset_key)
-
-            @asset(
-                key=AssetKey.from_user_string(asset_key),
-                deps=override_deps,
-                group_name=self.group_name,
-                metadata={
-                    "view_name": view_name,
-                    "schema": self.schema_name,
-                    "cluster": self.cluster_identifier,
-                },
-            )
-            def matview_asset(context: AssetExecutionContext, view_name=view_name):
-                """Refresh Redshift materialized view."""
-                session = self._get_boto3_session()
-
-                # Refresh materialized view
-                sql = f"REFRESH MATERIALIZED VIEW {view_name};"
-                context.log.info(f"Refreshing materialized view: {sql}")
-
-                result = self._execute_sql(session, sql, context)
-
-                return {
-                    "view_name": view_name,
-                    "schema": self.schema_name,
-                    **result,
-                }
-
-            assets.append(matview_asset)
-
-        return assets
+        if not views:
+            return []
+        return [_make_matview_multi_asset(self, views)]
 
     def build_defs(self, context: ComponentLoadContext) -> Definitions:
         """Build Dagster definitions from this component."""
-        session = self._get_boto3_session()
+        if not (self.import_scheduled_queries or self.import_stored_procedures or self.import_materialized_views):
+            return Definitions(assets=[])
 
         assets = []
 
         # Import scheduled queries
         if self.import_scheduled_queries:
-            assets.extend(self._get_scheduled_query_assets(session))
+            assets.extend(self._get_scheduled_query_assets())
+
+        if not (self.import_stored_procedures or self.import_materialized_views):
+            return Definitions(assets=assets)
+
+        if self._filters_exclude_everything():
+            _logger.info(
+                "AWSRedshiftComponent: exclude_name_pattern %r rejects every name matching "
+                "filter_by_name_pattern %r; skipping the catalog query.",
+                self.exclude_name_pattern,
+                self.filter_by_name_pattern,
+            )
+            return Definitions(assets=assets)
+
+        # List stored procedures and materialized views together
+        procedures, views = self._list_catalog()
 
         # Import stored procedures
         if self.import_stored_procedures:
-            assets.extend(self._get_stored_procedure_assets(session))
+            assets.extend(self._get_stored_procedure_assets(procedures))
 
         # Import materialized views
         if self.import_materialized_views:
-            assets.extend(self._get_materialized_view_assets(session))
+            assets.extend(self._get_materialized_view_assets(views))
 
         return Definitions(
             assets=assets,
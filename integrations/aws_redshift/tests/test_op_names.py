@@ -0,0 +1,83 @@
+"""Unit tests for AWSRedshiftComponent op naming.
+
+Two Redshift components loaded into the same code location must not produce
+conflicting op names for their stored procedure / materialized view
+multi-assets, even when they share the default group.
+
+Run from this directory:
+
+    pytest -q
+"""
+from __future__ import annotations
+
+import pytest
+
+# When running outside of an installed Dagster project, import the component file
+# directly so we don't depend on an installed dagster_component_templates package.
+import importlib.util
+import pathlib
+
+from dagster import Definitions
+
+_HERE = pathlib.Path(__file__).resolve().parent.parent
+_COMPONENT_PY = _HERE / "component.py"
+_spec = importlib.util.spec_from_file_location("aws_redshift_component", _COMPONENT_PY)
+assert _spec is not None and _spec.loader is not None
+_mod = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(_mod)
+
+AWSRedshiftComponent = _mod.AWSRedshiftComponent
+
+
+def _component(cluster_identifier: str, **kwargs) -> AWSRedshiftComponent:
+    return AWSRedshiftComponent(
+        cluster_identifier=cluster_identifier,
+        database="analytics",
+        aws_region="us-east-1",
+        import_stored_procedures=True,
+        import_materialized_views=True,
+        **kwargs,
+    )
+
+
+@pytest.fixture
+def catalogs(monkeypatch):
+    """Serve each component's catalog from a dict keyed by cluster identifier."""
+    listings = {}
+    monkeypatch.setattr(
+        AWSRedshiftComponent,
+        "_list_catalog",
+        lambda self: listings[self.cluster_identifier],
+    )
+    return listings
+
+
+def test_two_components_on_default_group_load_together(catalogs):
+    catalogs["cluster-a"] = (["load_orders"], ["public.orders_mv"])
+    catalogs["cluster-b"] = (["load_users"], ["public.users_mv"])
+
+    defs = Definitions.merge(
+        _component("cluster-a").build_defs(None),
+        _component("cluster-b").build_defs(None),
+    )
+
+    # Raises on conflicting node definitions with the same name.
+    Definitions.validate_loadable(defs)
+    assert {key.to_user_string() for key in defs.resolve_asset_graph().get_all_asset_keys()} == {
+        "procedure_load_orders",
+        "matview_orders_mv",
+        "procedure_load_users",
+        "matview_users_mv",
+    }
+
+
+def test_op_names_are_valid_for_any_cluster_and_schema(catalogs):
+    catalogs["my-cluster.prod"] = (["load_orders"], ["sales-2024.orders_mv"])
+
+    defs = _component("my-cluster.prod", schema_name="sales-2024").build_defs(None)
+
+    op_names = {assets_def.node_def.name for assets_def in defs.assets}
+    assert op_names == {
+        "aws_redshift_my_cluster_prod_analytics_sales_2024_call_stored_procedures",
+        "aws_redshift_my_cluster_prod_analytics_sales_2024_refresh_materialized_views",
+    }
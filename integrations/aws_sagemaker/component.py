@@ -6,15 +6,24 @@ as Dagster assets for orchestrating machine learning workflows.
 
 from dagster import AssetKey  # auto-added for hierarchical keys
 
+import hashlib
+import inspect
+import json
 import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Optional, List, Dict, Any
-from datetime import datetime, timedelta
+from functools import partial, wraps
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional, List, Dict, Any, Callable, FrozenSet, Iterator, Set, Tuple
+from datetime import datetime, timedelta, timezone
 
-import boto3
 from botocore.exceptions import ClientError
 
+if TYPE_CHECKING:
+    import boto3
+
 from dagster import (
     Component,
     ComponentLoadContext,
@@ -28,7 +37,53 @@ from dagster import (
     Model,
     MetadataValue,
 )
-from pydantic import Field
+from pydantic import Field, PrivateAttr
+
+
+# ─── Listing cache ────────────────────────────────────────────────────────────
+#
+# Every component load re-pages the SageMaker list APIs, although the set of
+# job templates and pipelines changes rarely. Listings are kept in-process and
+# mirrored to a JSON file so fresh code-server processes can reuse them too.
+# Entries are (fetched_at, names), keyed by a hash of everything that shapes
+# the listing; the lock serializes the file's read-modify-write across the
+# listing threads.
+
+_LISTING_CACHE: Dict[str, Tuple[float, List[str]]] = {}
+_LISTING_CACHE_PATH = Path.home() / ".cache" / "dagster_sagemaker_listing.json"
+_LISTING_CACHE_LOCK = threading.Lock()
+
+
+def _read_listing_cache_file() -> Dict[str, Any]:
+    try:
+        return json.loads(_LISTING_CACHE_PATH.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def _get_cached_listing(key: str, ttl: int) -> Optional[List[str]]:
+    """Return the cached names for ``key`` if younger than ``ttl`` seconds."""
+    with _LISTING_CACHE_LOCK:
+        entry = _LISTING_CACHE.get(key)
+        if entry is None:
+            disk_entry = _read_listing_cache_file().get(key)
+            if disk_entry:
+                entry = _LISTING_CACHE[key] = (disk_entry[0], disk_entry[1])
+    if entry is None or time.time() - entry[0] >= ttl:
+        return None
+    return entry[1]
+
+
+def _set_cached_listing(key: str, names: List[str]) -> None:
+    with _LISTING_CACHE_LOCK:
+        _LISTING_CACHE[key] = (time.time(), names)
+        disk_cache = _read_listing_cache_file()
+        disk_cache[key] = list(_LISTING_CACHE[key])
+        try:
+            _LISTING_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            _LISTING_CACHE_PATH.write_text(json.dumps(disk_cache))
+        except OSError:
+            pass
 
 
 # ─── Asset overrides (inline; kept per-component to preserve self-containment) ─
@@ -57,6 +112,175 @@ def _resolve_override_deps(
     return [AssetKey(d.split("/")) if "/" in d else AssetKey(d) for d in ov.depends_on]
 
 
+def _iter_pages(list_call: Callable[..., Dict[str, Any]], **kwargs: Any) -> Iterator[Dict[str, Any]]:
+    """Yield every response of a SageMaker ``List*`` call, following ``NextToken``.
+
+    A plain loop over the client method: boto3's ``PageIterator`` adds
+    per-page bookkeeping (result-key searches, token tracking) nothing here uses.
+    """
+    while True:
+        response = list_call(**kwargs)
+        yield response
+        next_token = response.get("NextToken")
+        if not next_token:
+            return
+        kwargs["NextToken"] = next_token
+
+
+def _wrap_client_errors(what: str):
+    """Decorate a listing generator to re-raise ``ClientError`` as ``RuntimeError``.
+
+    ``what`` names the listing in the message and may reference the
+    generator's arguments, e.g. ``"{job_type} jobs"``.
+    """
+    def decorator(list_fn: Callable[..., Iterator[Any]]) -> Callable[..., Iterator[Any]]:
+        signature = inspect.signature(list_fn)
+
+        @wraps(list_fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Iterator[Any]:
+            try:
+                yield from list_fn(*args, **kwargs)
+            except ClientError as e:
+                listing = what.format(**signature.bind(*args, **kwargs).arguments)
+                raise RuntimeError(f"Failed to list {listing}: {e}") from e
+
+        return wrapper
+
+    return decorator
+
+
+# ─── Job types ────────────────────────────────────────────────────────────────
+#
+# Training, transform and processing jobs are listed, described and reported
+# the same way; only the API operation and field names differ.
+
+
+def _training_job_details(job: Dict[str, Any]) -> Dict[str, str]:
+    return {
+        "algorithm": job.get("AlgorithmSpecification", {}).get("TrainingImage", ""),
+        "instance_type": job.get("ResourceConfig", {}).get("InstanceType", ""),
+    }
+
+
+def _transform_job_details(job: Dict[str, Any]) -> Dict[str, str]:
+    return {
+        "model_name": job.get("ModelName", ""),
+        "instance_type": job.get("TransformResources", {}).get("InstanceType", ""),
+    }
+
+
+def _processing_job_details(job: Dict[str, Any]) -> Dict[str, str]:
+    return {
+        "instance_type": job.get("ProcessingResources", {}).get("ClusterConfig", {}).get("InstanceType", ""),
+    }
+
+
+@dataclass(frozen=True)
+class _JobType:
+    list_operation: str
+    summary_key: str
+    name_key: str
+    arn_key: str
+    describe_operation: str
+    template_details: Callable[[Dict[str, Any]], Dict[str, str]]
+    # Resource type for tag filtering; only training jobs are tag-filtered
+    tag_resource_type: Optional[str] = None
+
+
+_JOB_TYPES: Dict[str, _JobType] = {
+    "training": _JobType(
+        list_operation="list_training_jobs",
+        summary_key="TrainingJobSummaries",
+        name_key="TrainingJobName",
+        arn_key="TrainingJobArn",
+        describe_operation="describe_training_job",
+        template_details=_training_job_details,
+        tag_resource_type="sagemaker:training-job",
+    ),
+    "transform": _JobType(
+        list_operation="list_transform_jobs",
+        summary_key="TransformJobSummaries",
+        name_key="TransformJobName",
+        arn_key="TransformJobArn",
+        describe_operation="describe_transform_job",
+        template_details=_transform_job_details,
+    ),
+    "processing": _JobType(
+        list_operation="list_processing_jobs",
+        summary_key="ProcessingJobSummaries",
+        name_key="ProcessingJobName",
+        arn_key="ProcessingJobArn",
+        describe_operation="describe_processing_job",
+        template_details=_processing_job_details,
+    ),
+}
+
+
+# describe_pipeline_execution error codes for an execution that can never be
+# resolved; the observation sensor drops such executions from its cursor.
+_UNRESOLVABLE_EXECUTION_ERROR_CODES = frozenset({"ResourceNotFound", "ValidationException"})
+
+# Entity types the observation sensor keeps a separate time window for.
+_OBSERVED_KINDS = frozenset({"training", "transform", "processing", "pipeline"})
+
+# How far back the observation sensor re-reads a window whose listing keeps
+# failing, in seconds.
+_MAX_OBSERVATION_WINDOW = 24 * 3600
+
+
+# Leading run of plain characters in a filter pattern, after an optional ^.
+_LITERAL_PREFIX_RE = re.compile(r"\^?([A-Za-z0-9_\- ]+)")
+
+
+def _literal_hint(pattern: Optional[str]) -> Optional[str]:
+    """Return a substring every match of ``pattern`` must contain, if obvious.
+
+    Only the pattern's leading literal run is considered, and patterns with
+    alternation are skipped, so a ``None`` result just means "unknown".
+    """
+    if not pattern or "|" in pattern:
+        return None
+    m = _LITERAL_PREFIX_RE.match(pattern)
+    if not m:
+        return None
+    literal = m.group(1)
+    # A trailing ?, * or {m,n} can make the last character optional.
+    if pattern[m.end():m.end() + 1] in ("?", "*", "{"):
+        literal = literal[:-1]
+    return literal or None
+
+
+# Inline global flags such as (?i) must open a pattern, so such patterns can't
+# be embedded in a combined one.
+_GLOBAL_FLAGS_RE = re.compile(r"\(\?[aiLmsux]+\)")
+
+
+def _combine_patterns(include: re.Pattern, exclude: re.Pattern) -> Optional[re.Pattern]:
+    """Fold ``include`` and ``exclude`` into one pattern for ``match``.
+
+    ``combined.match(name)`` is equivalent to ``include.search(name) and not
+    exclude.search(name)``. Returns None when the patterns can't be embedded
+    safely: inline global flags, or groups in ``exclude`` whose numbers would
+    shift behind ``include``'s.
+    """
+    if exclude.groups or any(
+        _GLOBAL_FLAGS_RE.search(p.pattern) for p in (include, exclude)
+    ):
+        return None
+    try:
+        return re.compile(
+            rf"(?=[\s\S]*?(?:{include.pattern}))(?![\s\S]*?(?:{exclude.pattern}))"
+        )
+    except re.error:
+        return None
+
+
+# Characters SageMaker accepts in the NameContains / PipelineNamePrefix
+# list filters (and in job and pipeline names themselves).
+_SERVER_FILTER_RE = re.compile(r"[A-Za-z0-9-]+")
+_NAME_CONTAINS_MAX_LENGTH = 63
+
+
 class AWSSageMakerComponent(Component, Model, Resolvable):
     """Component for importing AWS SageMaker entities as Dagster assets.
 
@@ -144,6 +368,11 @@ class AWSSageMakerComponent(Component, Model, Resolvable):
         description="Generate observation sensor for completed jobs"
     )
 
+    listing_cache_ttl: int = Field(
+        default=300,
+        description="Seconds to reuse the job and pipeline listings across component loads (0 disables caching)"
+    )
+
     group_name: str = Field(
         default="aws_sagemaker",
         description="Asset group name for all imported assets"
@@ -164,8 +393,50 @@ class AWSSageMakerComponent(Component, Model, Resolvable):
         ),
     )
 
-    def _get_boto3_session(self) -> boto3.Session:
-        """Create boto3 session with credentials."""
+    _filter_re: Optional[re.Pattern] = PrivateAttr(default=None)
+    _exclude_re: Optional[re.Pattern] = PrivateAttr(default=None)
+    _combined_re: Optional[re.Pattern] = PrivateAttr(default=None)
+    _filter_hint: Optional[str] = PrivateAttr(default=None)
+    _exclude_hint: Optional[str] = PrivateAttr(default=None)
+    _name_contains: Optional[str] = PrivateAttr(default=None)
+    _pipeline_name_prefix: Optional[str] = PrivateAttr(default=None)
+    _required_tag_keys: FrozenSet[str] = PrivateAttr(default=frozenset())
+    _session: Optional["boto3.Session"] = PrivateAttr(default=None)
+    _clients: Dict[str, Any] = PrivateAttr(default_factory=dict)
+    _client_lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+    _account_id: Optional[str] = PrivateAttr(default=None)
+
+    def model_post_init(self, __context: Any) -> None:
+        """Compile the name filter patterns and parse tag keys once per instance."""
+        self._filter_re = re.compile(self.filter_by_name_pattern) if self.filter_by_name_pattern else None
+        self._exclude_re = re.compile(self.exclude_name_pattern) if self.exclude_name_pattern else None
+        if self._filter_re is not None and self._exclude_re is not None:
+            self._combined_re = _combine_patterns(self._filter_re, self._exclude_re)
+        self._filter_hint = _literal_hint(self.filter_by_name_pattern)
+        self._exclude_hint = _literal_hint(self.exclude_name_pattern)
+
+        # The inclusion literal can also narrow the listings server-side; the
+        # regex still runs on whatever comes back.
+        if self._filter_hint and _SERVER_FILTER_RE.fullmatch(self._filter_hint):
+            self._name_contains = self._filter_hint[:_NAME_CONTAINS_MAX_LENGTH]
+            if self.filter_by_name_pattern.startswith("^"):
+                self._pipeline_name_prefix = self._filter_hint.rstrip("-") or None
+        if self.filter_by_tags:
+            self._required_tag_keys = frozenset(k.strip() for k in self.filter_by_tags.split(","))
+
+    def _get_boto3_session(self) -> "boto3.Session":
+        """Return the component's boto3 session, creating it on first use.
+
+        Credentials are resolved once per process; those from the default
+        provider chain (instance profiles, assumed roles) refresh themselves.
+        boto3 is imported here rather than at module level so that loading
+        code locations which never build this component skips its import cost.
+        """
+        if self._session is not None:
+            return self._session
+
+        import boto3
+
         session_kwargs = {"region_name": self.aws_region}
 
         if self.aws_access_key_id and self.aws_secret_access_key:
@@ -175,331 +446,270 @@ class AWSSageMakerComponent(Component, Model, Resolvable):
         if self.aws_session_token:
             session_kwargs["aws_session_token"] = self.aws_session_token
 
-        return boto3.Session(**session_kwargs)
+        self._session = boto3.Session(**session_kwargs)
+        return self._session
+
+    def _get_client(self, service_name: str):
+        """Return a cached client for ``service_name``.
+
+        Clients are thread-safe and shared by listing, every asset run and the
+        sensor. Creation goes through a boto3 session, which is not, so it is
+        serialized with a lock.
+        """
+        client = self._clients.get(service_name)
+        if client is None:
+            with self._client_lock:
+                client = self._clients.get(service_name)
+                if client is None:
+                    client = self._get_boto3_session().client(service_name)
+                    self._clients[service_name] = client
+        return client
+
+    def _get_account_id(self) -> str:
+        """Return the AWS account the component's credentials belong to.
+
+        Looked up once through STS; role, profile and default-chain
+        credentials carry no access key ID to tell accounts apart.
+        """
+        if self._account_id is None:
+            self._account_id = self._get_client("sts").get_caller_identity()["Account"]
+        return self._account_id
+
+    def _matches_filters(self, name: str) -> bool:
+        """Check if entity matches name filters.
+
+        Tag filters are applied by ``_list_tagged_arns`` instead.
+        """
+        # A missing inclusion literal rules the name out without any regex
+        if self._filter_hint is not None and self._filter_hint not in name:
+            return False
+
+        # Inclusion and exclusion in a single regex pass when both are set
+        if self._combined_re is not None:
+            if not self._combined_re.match(name):
+                return False
 
-    def _matches_filters(self, name: str, tags: Optional[List[Dict[str, str]]] = None) -> bool:
-        """Check if entity matches name and tag filters."""
         # Name pattern filter
-        if self.filter_by_name_pattern:
-            if not re.search(self.filter_by_name_pattern, name):
-                return False
+        elif self._filter_re is not None and not self._filter_re.search(name):
+            return False
 
         # Exclusion pattern
-        if self.exclude_name_pattern:
-            if re.search(self.exclude_name_pattern, name):
-                return False
-
-        # Tag filter
-        if self.filter_by_tags and tags:
-            required_keys = [k.strip() for k in self.filter_by_tags.split(",")]
-            tag_dict = {tag["Key"]: tag["Value"] for tag in tags}
-            if not all(key in tag_dict for key in required_keys):
-                return False
+        if self._combined_re is None and self._exclude_re is not None:
+            if self._exclude_hint is None or self._exclude_hint in name:
+                if self._exclude_re.search(name):
+                    return False
 
         return True
 
-    def _list_training_job_definitions(self, session: boto3.Session) -> List[str]:
-        """List recent training jobs to use as templates."""
-        sagemaker = session.client("sagemaker")
-        job_names = []
-
-        try:
-            # Get recent training jobs (last 30 days)
-            creation_time_after = datetime.utcnow() - timedelta(days=30)
-
-            paginator = sagemaker.get_paginator("list_training_jobs")
-            for page in paginator.paginate(
-                CreationTimeAfter=creation_time_after,
-                StatusEquals="Completed",
-                MaxResults=100
-            ):
-                for job in page["TrainingJobSummaries"]:
-                    job_name = job["TrainingJobName"]
-                    tags_response = sagemaker.list_tags(ResourceArn=job["TrainingJobArn"])
-                    tags = tags_response.get("Tags", [])
-
-                    if self._matches_filters(job_name, tags):
-                        job_names.append(job_name)
-
-        except ClientError as e:
-            raise Exception(f"Failed to list training jobs: {e}")
-
-        return job_names
-
-    def _list_transform_job_definitions(self, session: boto3.Session) -> List[str]:
-        """List recent transform jobs to use as templates."""
-        sagemaker = session.client("sagemaker")
-        job_names = []
-
-        try:
-            creation_time_after = datetime.utcnow() - timedelta(days=30)
-
-            paginator = sagemaker.get_paginator("list_transform_jobs")
-            for page in paginator.paginate(
-                CreationTimeAfter=creation_time_after,
-                StatusEquals="Completed",
-                MaxResults=100
-            ):
-                for job in page["TransformJobSummaries"]:
-                    job_name = job["TransformJobName"]
-
-                    if self._matches_filters(job_name):
-                        job_names.append(job_name)
-
-        except ClientError as e:
-            raise Exception(f"Failed to list transform jobs: {e}")
-
-        return job_names
-
-    def _list_processing_job_definitions(self, session: boto3.Session) -> List[str]:
-        """List recent processing jobs to use as templates."""
-        sagemaker = session.client("sagemaker")
-        job_names = []
-
-        try:
-            creation_time_after = datetime.utcnow() - timedelta(days=30)
-
-            paginator = sagemaker.get_paginator("list_processing_jobs")
-            for page in paginator.paginate(
-                CreationTimeAfter=creation_time_after,
-                StatusEquals="Completed",
-                MaxResults=100
-            ):
-                for job in page["ProcessingJobSummaries"]:
-                    job_name = job["ProcessingJobName"]
-
-                    if self._matches_filters(job_name):
-                        job_names.append(job_name)
-
-        except ClientError as e:
-            raise Exception(f"Failed to list processing jobs: {e}")
-
-        return job_names
-
-    def _list_pipelines(self, session: boto3.Session) -> List[Dict[str, str]]:
-        """List SageMaker pipelines."""
-        sagemaker = session.client("sagemaker")
-        pipelines = []
-
-        try:
-            paginator = sagemaker.get_paginator("list_pipelines")
-            for page in paginator.paginate():
-                for pipeline in page["PipelineSummaries"]:
-                    pipeline_name = pipeline["PipelineName"]
-
-                    if self._matches_filters(pipeline_name):
-                        pipelines.append({
-                            "name": pipeline_name,
-                            "arn": pipeline["PipelineArn"]
-                        })
-
-        except ClientError as e:
-            raise Exception(f"Failed to list pipelines: {e}")
-
-        return pipelines
-
-    def _get_training_job_assets(self, session: boto3.Session) -> List:
-        """Generate training job assets."""
-        assets = []
-        job_names = self._list_training_job_definitions(session)
-
-        for job_name in job_names:
-            asset_key = f"training_job_{job_name}"
-            override_deps = _resolve_override_deps(self.asset_overrides, asset_key)
-
-            @asset(
-                key=AssetKey.from_user_string(asset_key),
-                deps=override_deps,
-                group_name=self.group_name,
-                metadata={
-                    "job_name": job_name,
-                    "job_type": "training",
-                    "aws_region": self.aws_region,
-                },
-            )
-            def training_asset(context: AssetExecutionContext, job_name=job_name):
-                """Create new training job based on template."""
-                session = self._get_boto3_session()
-                sagemaker = session.client("sagemaker")
-
-                # Get original job as template
-                try:
-                    orig_job = sagemaker.describe_training_job(TrainingJobName=job_name)
-
-                    # Create new job name with timestamp
-                    new_job_name = f"{job_name}-{int(datetime.utcnow().timestamp())}"
-
-                    context.log.info(f"Creating training job: {new_job_name}")
-
-                    # Create new training job (simplified - would need full config)
-                    # Note: This is a template - actual implementation needs all training job parameters
+    def _list_tagged_arns(self, resource_type: str) -> Set[str]:
+        """Return ARNs of ``resource_type`` resources carrying every required tag key.
+
+        One paginated Resource Groups Tagging API scan replaces a ``list_tags``
+        call per resource; key-only tag filters match any value and are ANDed.
+        """
+        tagging = self._get_client("resourcegroupstaggingapi")
+        arns = set()
+
+        paginator = tagging.get_paginator("get_resources")
+        for page in paginator.paginate(
+            ResourceTypeFilters=[resource_type],
+            TagFilters=[{"Key": key} for key in sorted(self._required_tag_keys)],
+        ):
+            for resource in page["ResourceTagMappingList"]:
+                arns.add(resource["ResourceARN"])
+
+        return arns
+
+    def _cached_listing(
+        self,
+        kind: str,
+        list_names: Callable[[], Iterator[str]],
+        created_after: Optional[datetime] = None,
+    ) -> Iterator[str]:
+        """Return ``list_names()``, or a ``kind`` listing younger than ``listing_cache_ttl`` seconds.
+
+        Uncached listings stream page by page; cached ones are materialized
+        once so they can be stored. Entries are keyed by account and region,
+        and by the day of ``created_after`` so jobs that age out of the
+        listing window are not served from an older entry.
+        """
+        if self.listing_cache_ttl <= 0:
+            return list_names()
+
+        cache_key = hashlib.sha256(json.dumps([
+            self._get_account_id(),
+            self.aws_region,
+            created_after.date().isoformat() if created_after else None,
+            kind,
+            self.filter_by_name_pattern,
+            self.exclude_name_pattern,
+            self.filter_by_tags,
+        ]).encode()).hexdigest()
+        cached = _get_cached_listing(cache_key, self.listing_cache_ttl)
+        if cached is not None:
+            return iter(cached)
+
+        names = list(list_names())
+        _set_cached_listing(cache_key, names)
+        return iter(names)
+
+    @_wrap_client_errors("{job_type} jobs")
+    def _list_jobs(self, job_type: str, creation_time_after: datetime) -> Iterator[str]:
+        """Yield completed ``job_type`` jobs created after ``creation_time_after``, page by page."""
+        spec = _JOB_TYPES[job_type]
+        sagemaker = self._get_client("sagemaker")
+
+        # Tags are only needed when filtering on them
+        tagged_arns = (
+            self._list_tagged_arns(spec.tag_resource_type)
+            if self._required_tag_keys and spec.tag_resource_type
+            else None
+        )
 
-                    metadata = {
-                        "original_job": job_name,
-                        "new_job_name": new_job_name,
-                        "algorithm": orig_job.get("AlgorithmSpecification", {}).get("TrainingImage", ""),
-                        "instance_type": orig_job.get("ResourceConfig", {}).get("InstanceType", ""),
-                        "note": "Template job - implement full training job creation logic"
+        list_kwargs = {
+            "CreationTimeAfter": creation_time_after,
+            "StatusEquals": "Completed",
+            "MaxResults": 100,
+        }
+        if self._name_contains:
+            list_kwargs["NameContains"] = self._name_contains
+
+        for page in _iter_pages(getattr(sagemaker, spec.list_operation), **list_kwargs):
+            for job in page[spec.summary_key]:
+                job_name = job[spec.name_key]
+                if tagged_arns is not None and job[spec.arn_key] not in tagged_arns:
+                    continue
+
+                if self._matches_filters(job_name):
+                    yield job_name
+
+    @_wrap_client_errors("pipelines")
+    def _list_pipelines(self) -> Iterator[Dict[str, str]]:
+        """Yield SageMaker pipelines, page by page."""
+        sagemaker = self._get_client("sagemaker")
+
+        list_kwargs = {"MaxResults": 100}
+        if self._pipeline_name_prefix:
+            list_kwargs["PipelineNamePrefix"] = self._pipeline_name_prefix
+
+        for page in _iter_pages(sagemaker.list_pipelines, **list_kwargs):
+            for pipeline in page["PipelineSummaries"]:
+                pipeline_name = pipeline["PipelineName"]
+
+                if self._matches_filters(pipeline_name):
+                    yield {
+                        "name": pipeline_name,
+                        "arn": pipeline["PipelineArn"]
                     }
 
-                    return metadata
-
-                except ClientError as e:
-                    context.log.error(f"Failed to create training job: {e}")
-                    raise
-
-            assets.append(training_asset)
-
-        return assets
-
-    def _get_transform_job_assets(self, session: boto3.Session) -> List:
-        """Generate transform job assets."""
-        assets = []
-        job_names = self._list_transform_job_definitions(session)
-
-        for job_name in job_names:
-            asset_key = f"transform_job_{job_name}"
-            override_deps = _resolve_override_deps(self.asset_overrides, asset_key)
-
-            @asset(
-                key=AssetKey.from_user_string(asset_key),
-                deps=override_deps,
-                group_name=self.group_name,
-                metadata={
-                    "job_name": job_name,
-                    "job_type": "transform",
-                    "aws_region": self.aws_region,
-                },
-            )
-            def transform_asset(context: AssetExecutionContext, job_name=job_name):
-                """Create new transform job based on template."""
-                session = self._get_boto3_session()
-                sagemaker = session.client("sagemaker")
+    def _build_job_asset(self, job_type: str, job_name: str, metadata_template: Dict[str, str]):
+        """Build the materializable asset for a single ``job_type`` job template."""
+        asset_key = f"{job_type}_job_{job_name}"
+        override_deps = _resolve_override_deps(self.asset_overrides, asset_key)
+        spec = _JOB_TYPES[job_type]
+        describe_job = getattr(self._get_client("sagemaker"), spec.describe_operation)
+
+        asset_metadata = metadata_template.copy()
+        asset_metadata["job_name"] = job_name
+        # Run results only add the new job name and the template's settings
+        result_template = {
+            "original_job": job_name,
+            "note": f"Template job - implement full {job_type} job creation logic",
+        }
+
+        @asset(
+            key=AssetKey.from_user_string(asset_key),
+            deps=override_deps,
+            group_name=self.group_name,
+            metadata=asset_metadata,
+        )
+        def job_asset(context: AssetExecutionContext):
+            """Create new job based on template."""
+            # Get original job as template
+            try:
+                orig_job = describe_job(**{spec.name_key: job_name})
 
-                try:
-                    orig_job = sagemaker.describe_transform_job(TransformJobName=job_name)
+                # Create new job name with timestamp
+                new_job_name = f"{job_name}-{int(time.time())}"
 
-                    new_job_name = f"{job_name}-{int(datetime.utcnow().timestamp())}"
+                context.log.info(f"Creating {job_type} job: {new_job_name}")
 
-                    context.log.info(f"Creating transform job: {new_job_name}")
+                # Create new job (simplified - would need full config)
+                # Note: This is a template - actual implementation needs all job parameters
 
-                    metadata = {
-                        "original_job": job_name,
-                        "new_job_name": new_job_name,
-                        "model_name": orig_job.get("ModelName", ""),
-                        "instance_type": orig_job.get("TransformResources", {}).get("InstanceType", ""),
-                        "note": "Template job - implement full transform job creation logic"
-                    }
+                metadata = result_template.copy()
+                metadata["new_job_name"] = new_job_name
+                metadata.update(spec.template_details(orig_job))
 
-                    return metadata
+                return metadata
 
-                except ClientError as e:
-                    context.log.error(f"Failed to create transform job: {e}")
-                    raise
+            except ClientError as e:
+                context.log.error(f"Failed to create {job_type} job: {e}")
+                raise
 
-            assets.append(transform_asset)
+        return job_asset
 
-        return assets
-
-    def _get_processing_job_assets(self, session: boto3.Session) -> List:
-        """Generate processing job assets."""
-        assets = []
-        job_names = self._list_processing_job_definitions(session)
-
-        for job_name in job_names:
-            asset_key = f"processing_job_{job_name}"
-            override_deps = _resolve_override_deps(self.asset_overrides, asset_key)
-
-            @asset(
-                key=AssetKey.from_user_string(asset_key),
-                deps=override_deps,
-                group_name=self.group_name,
-                metadata={
-                    "job_name": job_name,
-                    "job_type": "processing",
-                    "aws_region": self.aws_region,
-                },
+    def _get_job_assets(self, job_type: str, creation_time_after: datetime) -> List:
+        """Generate assets for ``job_type`` jobs created after ``creation_time_after``."""
+        metadata_template = {"job_type": job_type, "aws_region": self.aws_region}
+        return [
+            self._build_job_asset(job_type, job_name, metadata_template)
+            for job_name in self._cached_listing(
+                job_type, partial(self._list_jobs, job_type, creation_time_after), creation_time_after
             )
-            def processing_asset(context: AssetExecutionContext, job_name=job_name):
-                """Create new processing job based on template."""
-                session = self._get_boto3_session()
-                sagemaker = session.client("sagemaker")
-
-                try:
-                    orig_job = sagemaker.describe_processing_job(ProcessingJobName=job_name)
+        ]
+
+    def _build_pipeline_asset(self, pipeline_name: str, metadata_template: Dict[str, str]):
+        """Build the materializable asset for a single pipeline."""
+        asset_key = f"pipeline_{pipeline_name}"
+        override_deps = _resolve_override_deps(self.asset_overrides, asset_key)
+        sagemaker = self._get_client("sagemaker")
+
+        asset_metadata = metadata_template.copy()
+        asset_metadata["pipeline_name"] = pipeline_name
+        result_template = {"pipeline_name": pipeline_name, "status": "Executing"}
+
+        @asset(
+            key=AssetKey.from_user_string(asset_key),
+            deps=override_deps,
+            group_name=self.group_name,
+            metadata=asset_metadata,
+        )
+        def pipeline_asset(context: AssetExecutionContext):
+            """Start SageMaker pipeline execution."""
+            try:
+                # Start pipeline execution
+                response = sagemaker.start_pipeline_execution(
+                    PipelineName=pipeline_name,
+                    PipelineExecutionDisplayName=f"execution-{int(time.time())}"
+                )
 
-                    new_job_name = f"{job_name}-{int(datetime.utcnow().timestamp())}"
+                execution_arn = response["PipelineExecutionArn"]
+                context.log.info(f"Pipeline execution started: {execution_arn}")
 
-                    context.log.info(f"Creating processing job: {new_job_name}")
+                metadata = result_template.copy()
+                metadata["execution_arn"] = execution_arn
 
-                    metadata = {
-                        "original_job": job_name,
-                        "new_job_name": new_job_name,
-                        "instance_type": orig_job.get("ProcessingResources", {}).get("ClusterConfig", {}).get("InstanceType", ""),
-                        "note": "Template job - implement full processing job creation logic"
-                    }
+                return metadata
 
-                    return metadata
+            except ClientError as e:
+                context.log.error(f"Failed to start pipeline: {e}")
+                raise
 
-                except ClientError as e:
-                    context.log.error(f"Failed to create processing job: {e}")
-                    raise
+        return pipeline_asset
 
-            assets.append(processing_asset)
-
-        return assets
-
-    def _get_pipeline_assets(self, session: boto3.Session) -> List:
+    def _get_pipeline_assets(self) -> List:
         """Generate pipeline assets."""
-        assets = []
-        pipelines = self._list_pipelines(session)
-
-        for pipeline in pipelines:
-            pipeline_name = pipeline["name"]
-            asset_key = f"pipeline_{pipeline_name}"
-            override_deps = _resolve_override_deps(self.asset_overrides, asset_key)
-
-            @asset(
-                key=AssetKey.from_user_string(asset_key),
-                deps=override_deps,
-                group_name=self.group_name,
-                metadata={
-                    "pipeline_name": pipeline_name,
-                    "aws_region": self.aws_region,
-                },
-            )
-            def pipeline_asset(context: AssetExecutionContext, pipeline_name=pipeline_name):
-                """Start SageMaker pipeline execution."""
-                session = self._get_boto3_session()
-                sagemaker = session.client("sagemaker")
-
-                try:
-                    # Start pipeline execution
-                    response = sagemaker.start_pipeline_execution(
-                        PipelineName=pipeline_name,
-                        PipelineExecutionDisplayName=f"execution-{int(datetime.utcnow().timestamp())}"
-                    )
-
-                    execution_arn = response["PipelineExecutionArn"]
-                    context.log.info(f"Pipeline execution started: {execution_arn}")
-
-                    metadata = {
-                        "pipeline_name": pipeline_name,
-                        "execution_arn": execution_arn,
-                        "status": "Executing"
-                    }
-
-                    return metadata
-
-                except ClientError as e:
-                    context.log.error(f"Failed to start pipeline: {e}")
-                    raise
-
-            assets.append(pipeline_asset)
-
-        return assets
+        pipeline_names = self._cached_listing(
+            "pipeline", lambda: (pipeline["name"] for pipeline in self._list_pipelines())
+        )
+        metadata_template = {"aws_region": self.aws_region}
+        return [
+            self._build_pipeline_asset(pipeline_name, metadata_template)
+            for pipeline_name in pipeline_names
+        ]
 
-    def _get_observation_sensor(self, session: boto3.Session):
+    def _get_observation_sensor(self):
         """Generate sensor to observe SageMaker jobs and pipelines."""
 
         @sensor(
@@ -508,74 +718,209 @@ class AWSSageMakerComponent(Component, Model, Resolvable):
         )
         def sagemaker_observation_sensor(context: SensorEvaluationContext):
             """Sensor to observe AWS SageMaker jobs and pipeline executions."""
-            sagemaker = session.client("sagemaker")
+            sagemaker = self._get_client("sagemaker")
+
+            # Get cursor: kind=<epoch seconds> for the last successful listing
+            # of each entity type (botocore takes epoch ints for timestamps, so
+            # nothing needs parsing per tick), then the pipeline executions
+            # still running at that check as name=arn pairs
+            now = int(time.time())
+            default_check = now - 3600
+            last_checks: Dict[str, int] = {}
+            running = []
+            for position, part in enumerate((context.cursor or "").split()):
+                key, separator, value = part.partition("=")
+                if value.startswith("arn:"):
+                    running.append((key, value))
+                elif separator and key in _OBSERVED_KINDS and value.isdigit():
+                    last_checks[key] = int(value)
+                elif position == 0 and part.isdigit():
+                    # Cursor written with one window shared by every kind
+                    default_check = int(part)
+                elif position == 0 and not separator:
+                    # Cursor written before the switch to epoch seconds (naive UTC)
+                    default_check = int(
+                        datetime.fromisoformat(part).replace(tzinfo=timezone.utc).timestamp()
+                    )
+
+            # Each kind re-reads its own window until its listing succeeds,
+            # capped so a persistent failure cannot grow it without bound
+            def window_start(kind: str) -> int:
+                return max(last_checks.get(kind, default_check), now - _MAX_OBSERVATION_WINDOW)
 
-            # Get cursor (last check time)
-            cursor = context.cursor
-            if cursor:
-                last_check = datetime.fromisoformat(cursor)
-            else:
-                last_check = datetime.utcnow() - timedelta(hours=1)
+            next_checks: Dict[str, int] = {}
 
-            now = datetime.utcnow()
+            # Metadata shared by every observation this tick
+            status_completed = MetadataValue.text("Completed")
+            status_succeeded = MetadataValue.text("Succeeded")
+            observed_at = MetadataValue.text(datetime.fromtimestamp(now, tz=timezone.utc).isoformat())
+
+            def observe_jobs(job_type: str) -> List[AssetMaterialization]:
+                """Observe ``job_type`` jobs that completed since the last check."""
+                spec = _JOB_TYPES[job_type]
+                last_check = window_start(job_type)
+                next_checks[job_type] = now
+                materializations = []
 
-            # Observe completed training jobs
-            if self.import_training_jobs:
                 try:
-                    paginator = sagemaker.get_paginator("list_training_jobs")
-                    for page in paginator.paginate(
-                        StatusEquals="Completed",
-                        LastModifiedTimeAfter=last_check,
-                        LastModifiedTimeBefore=now
-                    ):
-                        for job in page["TrainingJobSummaries"]:
-                            job_name = job["TrainingJobName"]
+                    list_kwargs = {
+                        "StatusEquals": "Completed",
+                        "LastModifiedTimeAfter": last_check,
+                        "LastModifiedTimeBefore": now,
+                        "MaxResults": 100,
+                    }
+                    if self._name_contains:
+                        list_kwargs["NameContains"] = self._name_contains
 
-                            if self._matches_filters(job_name):
-                                asset_key = f"training_job_{job_name}"
+                    for page in _iter_pages(getattr(sagemaker, spec.list_operation), **list_kwargs):
+                        for job in page[spec.summary_key]:
+                            job_name = job[spec.name_key]
 
-                                yield AssetMaterialization(
-                                    asset_key=asset_key,
+                            if self._matches_filters(job_name):
+                                materializations.append(AssetMaterialization(
+                                    asset_key=f"{job_type}_job_{job_name}",
                                     metadata={
                                         "job_name": MetadataValue.text(job_name),
-                                        "status": MetadataValue.text("Completed"),
-                                        "observed_at": MetadataValue.text(now.isoformat()),
+                                        "status": status_completed,
+                                        "observed_at": observed_at,
                                     },
-                                )
+                                ))
                 except ClientError as e:
-                    context.log.warning(f"Failed to list training jobs: {e}")
+                    context.log.warning(f"Failed to list {job_type} jobs: {e}")
+                    next_checks[job_type] = last_check
+
+                return materializations
+
+            still_running: Dict[str, str] = {}
+
+            def observe_pipelines() -> List[AssetMaterialization]:
+                """Observe pipeline executions that succeeded since the last check.
+
+                Execution summaries carry no end time, so executions are found
+                by start time and those still running are carried in the
+                cursor and re-checked on the next tick.
+                """
+                last_check = window_start("pipeline")
+                next_checks["pipeline"] = now
+                materializations = []
+                seen = set()
+
+                def record(pipeline_name: str, execution_arn: str, status: str) -> None:
+                    if execution_arn in seen:
+                        return
+                    seen.add(execution_arn)
+                    if status == "Succeeded":
+                        materializations.append(AssetMaterialization(
+                            asset_key=f"pipeline_{pipeline_name}",
+                            metadata={
+                                "pipeline_name": MetadataValue.text(pipeline_name),
+                                "execution_arn": MetadataValue.text(execution_arn),
+                                "status": status_succeeded,
+                                "observed_at": observed_at,
+                            },
+                        ))
+                    elif status == "Executing":
+                        still_running[execution_arn] = pipeline_name
+
+                # Each carried-over execution is checked on its own, so one
+                # bad ARN cannot hold back the others or the listing below
+                for pipeline_name, execution_arn in running:
+                    try:
+                        response = sagemaker.describe_pipeline_execution(
+                            PipelineExecutionArn=execution_arn
+                        )
+                    except ClientError as e:
+                        if e.response.get("Error", {}).get("Code") in _UNRESOLVABLE_EXECUTION_ERROR_CODES:
+                            context.log.warning(f"Dropping pipeline execution {execution_arn}: {e}")
+                        else:
+                            context.log.warning(f"Failed to describe pipeline execution {execution_arn}: {e}")
+                            still_running[execution_arn] = pipeline_name
+                        continue
+                    record(pipeline_name, execution_arn, response["PipelineExecutionStatus"])
 
-            # Update cursor
-            context.update_cursor(now.isoformat())
+                try:
+                    pipeline_names = self._cached_listing(
+                        "pipeline", lambda: (pipeline["name"] for pipeline in self._list_pipelines())
+                    )
+                    for pipeline_name in pipeline_names:
+                        for page in _iter_pages(
+                            sagemaker.list_pipeline_executions,
+                            PipelineName=pipeline_name,
+                            CreatedAfter=last_check,
+                            CreatedBefore=now,
+                            MaxResults=100,
+                        ):
+                            for execution in page["PipelineExecutionSummaries"]:
+                                record(
+                                    pipeline_name,
+                                    execution["PipelineExecutionArn"],
+                                    execution["PipelineExecutionStatus"],
+                                )
+                except Exception as e:
+                    context.log.warning(f"Failed to list pipeline executions: {e}")
+                    next_checks["pipeline"] = last_check
+
+                return materializations
+
+            # Observe every imported entity type concurrently; the SageMaker
+            # client is thread-safe and shared. Results are yielded in a fixed
+            # order so runs of the sensor are comparable.
+            observers = [
+                partial(observe_jobs, job_type)
+                for job_type, enabled in (
+                    ("training", self.import_training_jobs),
+                    ("transform", self.import_transform_jobs),
+                    ("processing", self.import_processing_jobs),
+                )
+                if enabled
+            ]
+            if self.import_pipelines:
+                observers.append(observe_pipelines)
+
+            if observers:
+                with ThreadPoolExecutor(max_workers=len(observers)) as pool:
+                    results = list(pool.map(lambda observe: observe(), observers))
+                for materializations in results:
+                    yield from materializations
+
+            # Update cursor; a kind whose listing failed keeps its window start,
+            # so only that kind re-reads it on the next tick
+            context.update_cursor(" ".join([
+                *(f"{kind}={check}" for kind, check in sorted(next_checks.items())),
+                *(f"{pipeline_name}={execution_arn}" for execution_arn, pipeline_name in still_running.items()),
+            ]))
 
         return sagemaker_observation_sensor
 
     def build_defs(self, context: ComponentLoadContext) -> Definitions:
         """Build Dagster definitions from this component."""
-        session = self._get_boto3_session()
-
         assets = []
         sensors = []
 
-        # Import training jobs
-        if self.import_training_jobs:
-            assets.extend(self._get_training_job_assets(session))
+        # Job templates are taken from the last 30 days
+        creation_time_after = datetime.now(timezone.utc) - timedelta(days=30)
 
-        # Import transform jobs
+        asset_builders = []
+        if self.import_training_jobs:
+            asset_builders.append(partial(self._get_job_assets, "training", creation_time_after))
         if self.import_transform_jobs:
-            assets.extend(self._get_transform_job_assets(session))
-
-        # Import processing jobs
+            asset_builders.append(partial(self._get_job_assets, "transform", creation_time_after))
         if self.import_processing_jobs:
-            assets.extend(self._get_processing_job_assets(session))
-
-        # Import pipelines
+            asset_builders.append(partial(self._get_job_assets, "processing", creation_time_after))
         if self.import_pipelines:
-            assets.extend(self._get_pipeline_assets(session))
+            asset_builders.append(self._get_pipeline_assets)
+
+        # List each entity type concurrently; results are collected in
+        # submission order so asset definitions stay stable between loads.
+        if asset_builders:
+            with ThreadPoolExecutor(max_workers=len(asset_builders)) as pool:
+                futures = [pool.submit(build) for build in asset_builders]
+                for future in futures:
+                    assets.extend(future.result())
 
         # Generate observation sensor
         if self.generate_sensor:
-            sensors.append(self._get_observation_sensor(session))
+            sensors.append(self._get_observation_sensor())
 
         return Definitions(
             assets=assets,
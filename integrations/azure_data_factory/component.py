@@ -9,18 +9,27 @@ On first load (state_path is None) returns empty Definitions — run
 `dg utils refresh-defs-state` or `dagster dev` to populate the cache.
 """
 
+import functools
 import json
 import os
 import re
+import threading
 import time
+import warnings
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
 import dagster as dg
 from pydantic import Field
 
+try:
+    import re2 as _re_engine  # google-re2: linear-time matching, no backtracking
+except ImportError:
+    _re_engine = re
+
 try:
     from dagster.components.component.state_backed_component import StateBackedComponent
     from dagster.components.utils.defs_state import (
@@ -74,82 +83,257 @@ class AzureDataFactoryResource(dg.ConfigurableResource):
 
     def get_client(self):
         """Return an authenticated DataFactoryManagementClient."""
-        from azure.identity import ClientSecretCredential, DefaultAzureCredential
         from azure.mgmt.datafactory import DataFactoryManagementClient
 
         if self.tenant_id_env_var and self.client_id_env_var and self.client_secret_env_var:
-            credential = ClientSecretCredential(
-                tenant_id=dg.EnvVar(self.tenant_id_env_var).get_value(),
-                client_id=dg.EnvVar(self.client_id_env_var).get_value(),
-                client_secret=dg.EnvVar(self.client_secret_env_var).get_value(),
+            credential = _get_credential(
+                dg.EnvVar(self.tenant_id_env_var).get_value(),
+                dg.EnvVar(self.client_id_env_var).get_value(),
+                dg.EnvVar(self.client_secret_env_var).get_value(),
             )
         else:
-            credential = DefaultAzureCredential()
+            credential = _get_credential(None, None, None)
 
         return DataFactoryManagementClient(credential, self.subscription_id)
 
 
 # ── Shared helpers ─────────────────────────────────────────────────────────────
 
-def _get_adf_client(
-    subscription_id: str,
+@functools.lru_cache(maxsize=16)
+def _get_credential(
     tenant_id: Optional[str],
     client_id: Optional[str],
     client_secret: Optional[str],
 ):
-    """Build an ADF management client from explicit credential values."""
+    """Return a shared Azure credential, so its AAD token cache survives across clients."""
     from azure.identity import ClientSecretCredential, DefaultAzureCredential
-    from azure.mgmt.datafactory import DataFactoryManagementClient
 
     if tenant_id and client_id and client_secret:
-        credential = ClientSecretCredential(
+        return ClientSecretCredential(
             tenant_id=tenant_id,
             client_id=client_id,
             client_secret=client_secret,
         )
-    else:
-        credential = DefaultAzureCredential()
+    return DefaultAzureCredential()
 
-    return DataFactoryManagementClient(credential, subscription_id)
 
+# Shared clients are used from several threads at once (sensor queries,
+# catalog listing, concurrent run polling); size the HTTPS pool to match.
+_CONNECTION_POOL_SIZE = 20
 
-def _matches_filters(
-    name: str,
-    filter_by_name_pattern: Optional[str],
-    exclude_name_pattern: Optional[str],
-    filter_by_tags: Optional[str],
-    tags: Optional[Dict[str, str]] = None,
-) -> bool:
-    """Return True if *name* passes all configured filters."""
-    if filter_by_name_pattern and not re.search(filter_by_name_pattern, name):
-        return False
-    if exclude_name_pattern and re.search(exclude_name_pattern, name):
-        return False
-    if filter_by_tags and tags:
-        required_keys = [k.strip() for k in filter_by_tags.split(",")]
-        if not all(k in tags for k in required_keys):
+
+def _build_transport():
+    """Return a requests transport whose connection pool fits concurrent use."""
+    import requests
+    from azure.core.pipeline.transport import RequestsTransport
+
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(
+        pool_connections=_CONNECTION_POOL_SIZE, pool_maxsize=_CONNECTION_POOL_SIZE
+    )
+    session.mount("https://", adapter)
+    return RequestsTransport(session=session, session_owner=False)
+
+
+# One management client per credential set, shared by every asset run and
+# sensor tick in the process so its connection pool and token cache are reused.
+_ADF_CLIENTS: Dict[tuple, Any] = {}
+_ADF_CLIENTS_LOCK = threading.Lock()
+
+# Worker threads for the sensor's concurrent run queries, kept across ticks.
+# Threads are only started on first use.
+_SENSOR_QUERY_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="adf-sensor")
+
+
+def _get_adf_client(
+    subscription_id: str,
+    tenant_id: Optional[str],
+    client_id: Optional[str],
+    client_secret: Optional[str],
+):
+    """Return a shared ADF management client for these credential values."""
+    cache_key = (subscription_id, tenant_id, client_id, client_secret)
+    client = _ADF_CLIENTS.get(cache_key)
+    if client is not None:
+        return client
+
+    with _ADF_CLIENTS_LOCK:
+        client = _ADF_CLIENTS.get(cache_key)
+        if client is None:
+            from azure.mgmt.datafactory import DataFactoryManagementClient
+
+            client = DataFactoryManagementClient(
+                _get_credential(tenant_id, client_id, client_secret),
+                subscription_id,
+                transport=_build_transport(),
+            )
+            _ADF_CLIENTS[cache_key] = client
+    return client
+
+
+# A name pattern that only matches a fixed set of names, e.g. ``^load$`` or
+# ``^(load|copy)$``; these can be pushed to ADF as a PipelineName filter.
+_LITERAL_NAME = r"[^.^$*+?{}\[\]\\|()]+"
+_EXACT_NAMES_RE = re.compile(
+    rf"\^(?:(?P<one>{_LITERAL_NAME})|\((?:\?:)?(?P<many>{_LITERAL_NAME}(?:\|{_LITERAL_NAME})*)\))\$"
+)
+
+_TERMINAL_RUN_STATUSES = frozenset(("Succeeded", "Failed", "Cancelled"))
+# Trigger-run statuses the sensor logs; other states are skipped.
+_LOGGED_TRIGGER_RUN_STATUSES = frozenset(("Succeeded", "Failed"))
+_STATUS_METADATA = {status: dg.MetadataValue.text(status) for status in _TERMINAL_RUN_STATUSES}
+# Reported for runs missing a start or end time
+_ZERO_DURATION = dg.MetadataValue.float(0.0)
+
+
+_GLOBAL_FLAGS_RE = re.compile(r"\(\?[aiLmsux]+\)")
+
+# A quantified group that itself contains an unbounded quantifier, e.g. ``(a+)+``,
+# or back-to-back ``.*``/``.+``; both can backtrack badly when a match fails.
+_BACKTRACKING_RISK_RE = re.compile(r"\([^()]*[*+][^()]*\)[*+{]|\.[*+]\??\.[*+]")
+
+# Perl classes and word boundaries, which RE2 matches on ASCII only while
+# ``re`` also matches non-ASCII letters, digits and spaces.
+_PERL_CLASS_RE = re.compile(r"\\[wWdDsSbB]")
+
+
+def _warn_if_backtracking(option: str, pattern: Optional[str]) -> None:
+    """Warn once per pattern about shapes prone to catastrophic backtracking."""
+    if pattern and _BACKTRACKING_RISK_RE.search(pattern):
+        warnings.warn(
+            f"AzureDataFactoryComponent: {option} {pattern!r} nests or repeats "
+            "unbounded quantifiers and may be very slow on names it does not "
+            "match; consider simplifying it (e.g. '.*.*' -> '.*', '(a+)+' -> 'a+').",
+            stacklevel=2,
+        )
+
+
+def _compile_pattern(option: str, pattern: str):
+    """Compile a user name pattern with RE2 when installed, else the stdlib ``re``.
+
+    Patterns using syntax RE2 does not support (backreferences, lookaround)
+    or Perl classes such as ``\\w`` (ASCII-only in RE2) use ``re`` so existing
+    filters keep matching the same names.
+    """
+    if _re_engine is not re and not _PERL_CLASS_RE.search(pattern):
+        try:
+            return _re_engine.compile(pattern)
+        except _re_engine.error:
+            pass
+    _warn_if_backtracking(option, pattern)
+    return re.compile(pattern)
+
+
+def _combine_patterns(include: "re.Pattern[str]", exclude: "re.Pattern[str]") -> Optional["re.Pattern[str]"]:
+    """Fold ``include`` and ``exclude`` into one pattern for ``match``.
+
+    ``combined.match(name)`` is equivalent to ``include.search(name) and not
+    exclude.search(name)``. Returns None when the patterns can't be embedded
+    safely: inline global flags, or groups in ``exclude`` whose numbers would
+    shift behind ``include``'s.
+    """
+    if exclude.groups or any(
+        _GLOBAL_FLAGS_RE.search(p.pattern) for p in (include, exclude)
+    ):
+        return None
+    try:
+        return re.compile(rf"(?=[\s\S]*?(?:{include.pattern}))(?![\s\S]*?(?:{exclude.pattern}))")
+    except re.error:
+        return None
+
+
+@dataclass(frozen=True)
+class _NameFilters:
+    """Name/tag filters compiled once and reused for every entity checked.
+
+    Instances are immutable, so ``compile`` memoizes them per configuration
+    and reloads of the same component reuse the compiled patterns.
+    """
+
+    name_re: Optional["re.Pattern[str]"] = None
+    exclude_re: Optional["re.Pattern[str]"] = None
+    # Both name patterns in one, when they can be combined (see _combine_patterns)
+    combined_re: Optional["re.Pattern[str]"] = None
+    required_tag_keys: frozenset = frozenset()
+    # False when no filter is configured, letting callers skip matching entirely
+    active: bool = False
+
+    @classmethod
+    @functools.lru_cache(maxsize=32)
+    def compile(
+        cls,
+        filter_by_name_pattern: Optional[str],
+        exclude_name_pattern: Optional[str],
+        filter_by_tags: Optional[str] = None,
+    ) -> "_NameFilters":
+        required_tag_keys = frozenset(
+            k.strip() for k in (filter_by_tags or "").split(",") if k.strip()
+        )
+        name_re = (
+            _compile_pattern("filter_by_name_pattern", filter_by_name_pattern)
+            if filter_by_name_pattern
+            else None
+        )
+        exclude_re = (
+            _compile_pattern("exclude_name_pattern", exclude_name_pattern)
+            if exclude_name_pattern
+            else None
+        )
+        # RE2 has no lookaround, and already matches each pattern in linear
+        # time, so only stdlib patterns are folded into one pass.
+        combinable = isinstance(name_re, re.Pattern) and isinstance(exclude_re, re.Pattern)
+        return cls(
+            name_re=name_re,
+            exclude_re=exclude_re,
+            combined_re=_combine_patterns(name_re, exclude_re) if combinable else None,
+            required_tag_keys=required_tag_keys,
+            active=bool(filter_by_name_pattern or exclude_name_pattern or required_tag_keys),
+        )
+
+    def matches(self, name: str, tags: Optional[Iterable[str]] = None) -> bool:
+        """Return True if *name* passes all configured filters.
+
+        *tags* are the entity's ADF annotations. Annotations are arbitrary
+        JSON values; only string annotations count as tag keys, and an entity
+        must carry every ``filter_by_tags`` key, so unannotated entities are
+        excluded.
+        """
+        if not self.active:
+            return True
+        if self.combined_re is not None:
+            if not self.combined_re.match(name):
+                return False
+        elif self.name_re is not None and not self.name_re.search(name):
+            return False
+        elif self.exclude_re is not None and self.exclude_re.search(name):
             return False
-    return True
+        if self.required_tag_keys:
+            tag_keys = {tag for tag in tags or () if isinstance(tag, str)}
+            if not self.required_tag_keys.issubset(tag_keys):
+                return False
+        return True
+
+    def exact_names(self) -> Optional[List[str]]:
+        """Names the include pattern matches, when it is an anchored list of literals."""
+        if self.name_re is None or getattr(self.name_re, "flags", 0) & re.IGNORECASE:
+            return None
+        m = _EXACT_NAMES_RE.fullmatch(self.name_re.pattern)
+        if m is None:
+            return None
+        return [m.group("one")] if m.group("one") else m.group("many").split("|")
 
 
 def _fetch_pipelines(
     client,
     resource_group_name: str,
     factory_name: str,
-    filter_by_name_pattern: Optional[str],
-    exclude_name_pattern: Optional[str],
-    filter_by_tags: Optional[str],
+    filters: _NameFilters,
 ) -> List[Dict[str, Any]]:
     """List all matching pipelines and return serialisable dicts."""
     result = []
     for pipeline in client.pipelines.list_by_factory(resource_group_name, factory_name):
         name = pipeline.name or ""
-        if not _matches_filters(
-            name,
-            filter_by_name_pattern,
-            exclude_name_pattern,
-            filter_by_tags,
-        ):
+        if filters.active and not filters.matches(name, getattr(pipeline, "annotations", None)):
             continue
         # Count activities safely
         activities = getattr(pipeline, "activities", None) or []
@@ -168,19 +352,263 @@ def _fetch_triggers(
     client,
     resource_group_name: str,
     factory_name: str,
-    filter_by_name_pattern: Optional[str],
-    exclude_name_pattern: Optional[str],
-    filter_by_tags: Optional[str],
-) -> List[str]:
-    """List all matching trigger names."""
+    filters: _NameFilters,
+) -> List[Dict[str, Any]]:
+    """List all matching triggers and return serialisable dicts."""
     result = []
     for trigger in client.triggers.list_by_factory(resource_group_name, factory_name):
         name = trigger.name or ""
-        if _matches_filters(name, filter_by_name_pattern, exclude_name_pattern, filter_by_tags):
-            result.append(name)
+        properties = getattr(trigger, "properties", None)
+        if not filters.active or filters.matches(name, getattr(properties, "annotations", None)):
+            # e.g. ScheduleTrigger; kept so materialisations need no extra get()
+            result.append({"name": name, "type": getattr(properties, "type", None) or "Unknown"})
     return result
 
 
+# Ramp-up schedule for run-status polling; capped by run_poll_interval_seconds.
+_RUN_POLL_BACKOFF_SECONDS = (1, 2, 5, 10)
+
+
+def _run_poll_waits(max_interval: int) -> Iterator[float]:
+    """Yield sleep durations between run polls: a short ramp-up, then *max_interval*."""
+    for wait in _RUN_POLL_BACKOFF_SECONDS:
+        if wait >= max_interval:
+            break
+        yield wait
+    while True:
+        yield max_interval
+
+
+def _fetch_catalog(
+    client,
+    resource_group_name: str,
+    factory_name: str,
+    import_pipelines: bool,
+    import_triggers: bool,
+    filter_by_name_pattern: Optional[str],
+    exclude_name_pattern: Optional[str],
+    filter_by_tags: Optional[str],
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """List pipelines and triggers concurrently; disabled entity types come back empty."""
+    filters = _NameFilters.compile(filter_by_name_pattern, exclude_name_pattern, filter_by_tags)
+    if not (import_pipelines and import_triggers):
+        # A single listing gains nothing from a worker thread.
+        return (
+            _fetch_pipelines(client, resource_group_name, factory_name, filters) if import_pipelines else [],
+            _fetch_triggers(client, resource_group_name, factory_name, filters) if import_triggers else [],
+        )
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        pipelines_future = pool.submit(_fetch_pipelines, client, resource_group_name, factory_name, filters)
+        triggers_future = pool.submit(_fetch_triggers, client, resource_group_name, factory_name, filters)
+        return pipelines_future.result(), triggers_future.result()
+
+
+# Short-lived in-process cache of listings for the non-state-backed path, which
+# lists the factory on every load. Keyed by factory and filter configuration.
+_CATALOG_CACHE_TTL_SECONDS = 300
+_CATALOG_CACHE: Dict[tuple, Tuple[float, Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]]] = {}
+_CATALOG_CACHE_LOCK = threading.Lock()
+
+
+def _fetch_catalog_cached(
+    client,
+    subscription_id: str,
+    resource_group_name: str,
+    factory_name: str,
+    *catalog_args: Any,
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """``_fetch_catalog`` behind a TTL cache; *catalog_args* are its remaining arguments."""
+    cache_key = (subscription_id, resource_group_name, factory_name, *catalog_args)
+    with _CATALOG_CACHE_LOCK:
+        hit = _CATALOG_CACHE.get(cache_key)
+    if hit is not None and time.monotonic() - hit[0] < _CATALOG_CACHE_TTL_SECONDS:
+        return hit[1]
+
+    catalog = _fetch_catalog(client, resource_group_name, factory_name, *catalog_args)
+    with _CATALOG_CACHE_LOCK:
+        _CATALOG_CACHE[cache_key] = (time.monotonic(), catalog)
+    return catalog
+
+
+def _iter_query_runs(query, response, *query_args: Any) -> Iterator[Any]:
+    """Yield runs from a run-query *response*, then from each continuation page.
+
+    *query_args* are the arguments *query* was first called with; the last one
+    is the RunFilterParameters, whose continuation_token is advanced in place.
+    """
+    params = query_args[-1]
+    while True:
+        yield from response.value or ()
+        token = getattr(response, "continuation_token", None)
+        if not token:
+            return
+        params.continuation_token = token
+        response = query(*query_args)
+
+
+def _build_run_metadata(run, pipeline_name_value: Optional[Any] = None) -> Dict[str, Any]:
+    """Metadata for a finished ADF pipeline run, shared by pipeline assets and the sensor.
+
+    *pipeline_name_value* lets the sensor pass a MetadataValue it already built.
+    """
+    text = dg.MetadataValue.text
+    status = run.status
+    run_start, run_end = run.run_start, run.run_end
+    metadata: Dict[str, Any] = {
+        "run_id": text(run.run_id or ""),
+        "status": _STATUS_METADATA.get(status) or text(status),
+        "pipeline_name": pipeline_name_value or text(run.pipeline_name or ""),
+        "start_time": text(str(run_start)),
+        "end_time": text(str(run_end)),
+        "duration_seconds": (
+            dg.MetadataValue.float((run_end - run_start).total_seconds())
+            if run_start and run_end
+            else _ZERO_DURATION
+        ),
+    }
+    if status == "Failed" and getattr(run, "message", None):
+        metadata["error"] = text(run.message)
+    return metadata
+
+
+def _with_retry_after(pipeline_response, deserialized, headers) -> Tuple[Any, float]:
+    """``cls`` hook for SDK calls: pair the result with its Retry-After seconds."""
+    retry_after = pipeline_response.http_response.headers.get("Retry-After", "")
+    return deserialized, float(retry_after) if retry_after.isdigit() else 0.0
+
+
+class _RunStatusBatcher:
+    """Shares pipeline-run status polls between runs awaited concurrently in one process.
+
+    With a single run registered this is a plain ``pipeline_runs.get``. With
+    several, whichever waiter finds the last snapshot older than its previous
+    poll refreshes every registered run in one ``query_by_factory`` call.
+    """
+
+    def __init__(self, client, resource_group_name: str, factory_name: str):
+        self._client = client
+        self._resource_group_name = resource_group_name
+        self._factory_name = factory_name
+        self._lock = threading.Lock()
+        self._waiting: Dict[str, Tuple[str, float]] = {}  # run_id -> (pipeline, registered at)
+        self._runs: Dict[str, Any] = {}
+        self._fetched_at = float("-inf")
+
+    def register(self, run_id: str, pipeline_name: str) -> None:
+        with self._lock:
+            self._waiting[run_id] = (pipeline_name, time.time())
+
+    def unregister(self, run_id: str) -> None:
+        with self._lock:
+            self._waiting.pop(run_id, None)
+            self._runs.pop(run_id, None)
+
+    def get(self, run_id: str, newer_than: float) -> Tuple[Any, float]:
+        """Return the run, fetched after the ``time.monotonic()`` value *newer_than*.
+
+        Also returns the service's Retry-After hint in seconds (0 if none).
+        """
+        with self._lock:
+            run = self._runs.get(run_id) if self._fetched_at > newer_than else None
+            if run is None and len(self._waiting) > 1:
+                fetched_at = time.monotonic()
+                self._runs = self._query_waiting()
+                self._fetched_at = fetched_at
+                run = self._runs.get(run_id)
+        if run is not None:
+            return run, 0.0
+        return self._client.pipeline_runs.get(
+            self._resource_group_name, self._factory_name, run_id, cls=_with_retry_after
+        )
+
+    def _query_waiting(self) -> Dict[str, Any]:
+        from azure.mgmt.datafactory.models import (
+            RunFilterParameters,
+            RunQueryFilter,
+            RunQueryFilterOperand,
+            RunQueryFilterOperator,
+        )
+
+        # Runs are only updated after they were created (and registered);
+        # allow a few minutes for clock skew against the service.
+        earliest = min(registered_at for _, registered_at in self._waiting.values())
+        now = time.time()
+        query = self._client.pipeline_runs.query_by_factory
+        query_args = (
+            self._resource_group_name,
+            self._factory_name,
+            RunFilterParameters(
+                last_updated_after=datetime.fromtimestamp(earliest - 300, tz=timezone.utc),
+                last_updated_before=datetime.fromtimestamp(now + 300, tz=timezone.utc),
+                filters=[
+                    RunQueryFilter(
+                        operand=RunQueryFilterOperand.PIPELINE_NAME,
+                        operator=RunQueryFilterOperator.IN,
+                        values=sorted({name for name, _ in self._waiting.values()}),
+                    )
+                ],
+            ),
+        )
+        return {
+            run.run_id: run
+            for run in _iter_query_runs(query, query(*query_args), *query_args)
+            if run.run_id in self._waiting
+        }
+
+
+_RUN_STATUS_BATCHERS: Dict[tuple, _RunStatusBatcher] = {}
+
+
+def _get_run_status_batcher(client, resource_group_name: str, factory_name: str) -> _RunStatusBatcher:
+    """Return the process-wide status batcher for this client and factory."""
+    key = (id(client), resource_group_name, factory_name)
+    with _ADF_CLIENTS_LOCK:
+        batcher = _RUN_STATUS_BATCHERS.get(key)
+        if batcher is None:
+            batcher = _RUN_STATUS_BATCHERS[key] = _RunStatusBatcher(
+                client, resource_group_name, factory_name
+            )
+    return batcher
+
+
+_INVALID_OP_NAME_CHARS_RE = re.compile(r"[^A-Za-z0-9_]")
+
+
+def _unique_op_names(prefix: str, names: Iterable[str]) -> Dict[str, str]:
+    """Map ADF entity names to valid, distinct Dagster op names.
+
+    ADF allows characters such as ``-`` that Dagster op names do not; those
+    become ``_``, and names that then collide get a numeric suffix. Names are
+    taken in sorted order so suffixes don't depend on listing order.
+    """
+    op_names: Dict[str, str] = {}
+    used = set()
+    for name in sorted(names):
+        base = prefix + _INVALID_OP_NAME_CHARS_RE.sub("_", name)
+        op_name, n = base, 1
+        while op_name in used:
+            n += 1
+            op_name = f"{base}_{n}"
+        used.add(op_name)
+        op_names[name] = op_name
+    return op_names
+
+
+def _dedupe_by_name(entities: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Drop entities whose name was already seen, keeping the first.
+
+    A listing that shifts between pages, or a hand-edited cache, can repeat a
+    name; each name must produce exactly one asset and op.
+    """
+    seen = set()
+    unique = []
+    for entity in entities:
+        if entity["name"] not in seen:
+            seen.add(entity["name"])
+            unique.append(entity)
+    return unique
+
+
 # ── assets_by_pipeline_name helpers ───────────────────────────────────────────
 
 def _merge_spec(base: dg.AssetSpec, ov: dict) -> dg.AssetSpec:
@@ -215,7 +643,7 @@ def _apply_pipeline_overrides(
 
 def _build_adf_defs(
     pipelines: List[Dict[str, Any]],
-    trigger_names: List[str],
+    triggers: List[Dict[str, Any]],
     subscription_id: str,
     resource_group_name: str,
     factory_name: str,
@@ -291,308 +719,339 @@ def _build_adf_defs(
     # Default kinds for ADF pipelines + any user additions
     _kinds = {"azure", "adf", *(extra_kinds or [])}
 
+    # Shared client lookup with this factory's credentials bound once
+    _adf_client = functools.partial(_get_adf_client, subscription_id, tenant_id, client_id, client_secret)
+
     # Helper for the ADF Monitor portal deeplink — always useful in metadata
-    def _monitor_url(run_id: str) -> str:
-        factory_uri = (
-            f"/subscriptions/{subscription_id}/resourceGroups/{resource_group_name}"
-            f"/providers/Microsoft.DataFactory/factories/{factory_name}"
-        )
-        return f"https://adf.azure.com/en/monitoring/pipelineruns/{run_id}?factory={factory_uri}"
+    _factory_uri = (
+        f"/subscriptions/{subscription_id}/resourceGroups/{resource_group_name}"
+        f"/providers/Microsoft.DataFactory/factories/{factory_name}"
+    )
 
-    # ── Pipeline assets ────────────────────────────────────────────────────────
-    if import_pipelines:
-        for pipeline_meta in pipelines:
-            pipeline_name = pipeline_meta["name"]
+    def _monitor_url(run_id: str) -> str:
+        return f"https://adf.azure.com/en/monitoring/pipelineruns/{run_id}?factory={_factory_uri}"
 
-            # Build the default AssetSpec for this pipeline
-            spec_kwargs = dict(
-                key=dg.AssetKey([f"adf_pipeline_{pipeline_name}"]),
-                description=pipeline_meta.get("description") or f"ADF pipeline: {pipeline_name}",
-                group_name=group_name,
-                metadata={
-                    "pipeline_name": dg.MetadataValue.text(pipeline_name),
-                    "factory_name": dg.MetadataValue.text(factory_name),
-                    "resource_group": dg.MetadataValue.text(resource_group_name),
-                    "activities_count": dg.MetadataValue.int(
-                        pipeline_meta.get("activities_count", 0)
-                    ),
-                    "parameters": dg.MetadataValue.text(
-                        ", ".join(pipeline_meta.get("parameters", [])) or "(none)"
-                    ),
-                },
-                kinds=_kinds,
-            )
-            if owners:
-                spec_kwargs["owners"] = owners
-            if asset_tags:
-                spec_kwargs["tags"] = asset_tags
-            if _partitions_def is not None:
-                spec_kwargs["partitions_def"] = _partitions_def
-            if _freshness is not None:
-                spec_kwargs["freshness_policy"] = _freshness
-            if upstream_asset_keys:
-                spec_kwargs["deps"] = [dg.AssetKey.from_user_string(k) for k in upstream_asset_keys]
-            default_spec = dg.AssetSpec(**spec_kwargs)
-
-            # Apply any user overrides (may expand to multiple specs)
-            expanded_specs = _apply_pipeline_overrides(
-                default_spec, pipeline_name, assets_by_pipeline_name
-            )
+    # Metadata shared by every pipeline and trigger asset in this factory
+    _metadata_base = {
+        "factory_name": dg.MetadataValue.text(factory_name),
+        "resource_group": dg.MetadataValue.text(resource_group_name),
+    }
+    _no_parameters_value = dg.MetadataValue.text("(none)")
+    # Parsed once; every pipeline asset depends on the same keys
+    _upstream_deps = [dg.AssetKey.from_user_string(k) for k in upstream_asset_keys or []]
 
-            # Build a spec_key_path tuple -> pipeline_name mapping for the execution body
-            spec_key_to_pipeline: Dict[tuple, str] = {
-                tuple(spec.key.path): pipeline_name for spec in expanded_specs
-            }
+    # ── Pipeline assets ────────────────────────────────────────────────────────
+    # Builders close over the per-entity values instead of taking them as
+    # default arguments, which Dagster would treat as asset inputs.
+    def _build_pipeline_asset(pipeline_meta: Dict[str, Any]) -> dg.AssetsDefinition:
+        pipeline_name = pipeline_meta["name"]
+        # Built once and shared by the spec and every materialization of this asset
+        pipeline_name_value = dg.MetadataValue.text(pipeline_name)
+
+        # Build the default AssetSpec for this pipeline
+        spec_kwargs = dict(
+            key=dg.AssetKey([f"adf_pipeline_{pipeline_name}"]),
+            description=pipeline_meta.get("description") or f"ADF pipeline: {pipeline_name}",
+            group_name=group_name,
+            metadata={
+                "pipeline_name": pipeline_name_value,
+                **_metadata_base,
+                "activities_count": dg.MetadataValue.int(
+                    pipeline_meta.get("activities_count", 0)
+                ),
+                "parameters": (
+                    dg.MetadataValue.text(", ".join(pipeline_meta["parameters"]))
+                    if pipeline_meta.get("parameters")
+                    else _no_parameters_value
+                ),
+            },
+            kinds=_kinds,
+        )
+        if owners:
+            spec_kwargs["owners"] = owners
+        if asset_tags:
+            spec_kwargs["tags"] = asset_tags
+        if _partitions_def is not None:
+            spec_kwargs["partitions_def"] = _partitions_def
+        if _freshness is not None:
+            spec_kwargs["freshness_policy"] = _freshness
+        if _upstream_deps:
+            spec_kwargs["deps"] = _upstream_deps
+        default_spec = dg.AssetSpec(**spec_kwargs)
+
+        # Apply any user overrides (may expand to multiple specs)
+        expanded_specs = _apply_pipeline_overrides(
+            default_spec, pipeline_name, assets_by_pipeline_name
+        )
 
-            # Capture loop-variable values via a factory closure. Putting them as
-            # default arguments confuses Dagster's multi_asset, which treats every
-            # parameter as an asset input.
-            def _make_pipeline_asset(
-                _pipeline_name=pipeline_name,
-                _subscription_id=subscription_id,
-                _resource_group_name=resource_group_name,
-                _factory_name=factory_name,
-                _tenant_id=tenant_id,
-                _client_id=client_id,
-                _client_secret=client_secret,
-                _spec_key_to_pipeline=spec_key_to_pipeline,
-                _pipeline_parameters=pipeline_parameters,
-                _partition_parameter_name=partition_parameter_name,
-                _max_wait_seconds=max_wait_seconds,
-                _poll_interval=run_poll_interval_seconds,
-                _wait_for_completion=wait_for_completion,
-                _capture_activity_metadata=capture_activity_metadata,
-            ):
-                @dg.multi_asset(
-                    specs=expanded_specs,
-                    name=f"adf_pipeline_{_pipeline_name}",
-                    retry_policy=_retry_policy,
+        # Reject key collisions (e.g. two overrides sharing a key) here, with the
+        # pipeline names, rather than deep inside Definitions construction.
+        for spec in expanded_specs:
+            other = _pipeline_by_key.setdefault(spec.key, pipeline_name)
+            if other != pipeline_name:
+                raise ValueError(
+                    f"ADF pipelines '{other}' and '{pipeline_name}' both map to asset key "
+                    f"{spec.key.to_user_string()!r}; adjust assets_by_pipeline_name."
                 )
-                def pipeline_multi_asset(context: dg.AssetExecutionContext):
-                    adf_client = _get_adf_client(
-                        _subscription_id, _tenant_id, _client_id, _client_secret
-                    )
 
-                    # Determine which ADF pipelines need to run for the selected asset keys
-                    selected_keys = set(
-                        tuple(k.path) for k in context.selected_asset_keys
-                    )
-                    pipelines_to_run: Dict[str, list] = {}
-                    for key_path, p_name in _spec_key_to_pipeline.items():
-                        if key_path in selected_keys:
-                            pipelines_to_run.setdefault(p_name, []).append(key_path)
-
-                    # Build the ADF pipeline parameters dict — user-provided +
-                    # auto-injected partition_key (when partitioned)
-                    adf_params: Dict[str, Any] = dict(_pipeline_parameters or {})
-                    if context.has_partition_key:
-                        pkey = context.partition_key
-                        pname = _partition_parameter_name or "partition_key"
-                        adf_params.setdefault(pname, pkey)
-                        context.log.info(
-                            f"partitioned run: passing {pname}={pkey} to ADF"
-                        )
-
-                    for p_name, key_paths in pipelines_to_run.items():
-                        create_kwargs: Dict[str, Any] = {}
-                        if adf_params:
-                            create_kwargs["parameters"] = adf_params
-                        run_response = adf_client.pipelines.create_run(
-                            _resource_group_name,
-                            _factory_name,
-                            p_name,
-                            **create_kwargs,
-                        )
-                        run_id = run_response.run_id
-                        monitor_url = _monitor_url(run_id)
-                        context.log.info(f"ADF pipeline run started. Run ID: {run_id}")
-                        context.log.info(f"Monitor: {monitor_url}")
+        # Build a spec_key_path tuple -> pipeline_name mapping for the execution body
+        spec_key_to_pipeline: Dict[tuple, str] = {
+            tuple(spec.key.path): pipeline_name for spec in expanded_specs
+        }
 
-                        if not _wait_for_completion:
-                            # Fire-and-forget — yield immediately
-                            for key_path in key_paths:
-                                yield dg.MaterializeResult(
-                                    asset_key=dg.AssetKey(list(key_path)),
-                                    metadata={
-                                        "run_id": dg.MetadataValue.text(run_id),
-                                        "status": dg.MetadataValue.text("Submitted"),
-                                        "pipeline_name": dg.MetadataValue.text(p_name),
-                                        "monitor_url": dg.MetadataValue.url(monitor_url),
-                                        "parameters": dg.MetadataValue.json(adf_params),
-                                    },
-                                )
-                            continue
+        @dg.multi_asset(
+            specs=expanded_specs,
+            name=_pipeline_op_names[pipeline_name],
+            retry_policy=_retry_policy,
+        )
+        def pipeline_multi_asset(context: dg.AssetExecutionContext):
+            adf_client = _adf_client()
 
-                        elapsed = 0
-                        pipeline_run = None
-                        while elapsed < _max_wait_seconds:
-                            pipeline_run = adf_client.pipeline_runs.get(
-                                _resource_group_name, _factory_name, run_id,
-                            )
-                            status = pipeline_run.status
-                            context.log.info(f"  poll: {p_name} status={status} elapsed={elapsed}s")
+            # Determine which ADF pipelines need to run for the selected asset keys
+            selected_keys = set(
+                tuple(k.path) for k in context.selected_asset_keys
+            )
+            pipelines_to_run: Dict[str, list] = {}
+            for key_path, p_name in spec_key_to_pipeline.items():
+                if key_path in selected_keys:
+                    pipelines_to_run.setdefault(p_name, []).append(key_path)
+
+            # Build the ADF pipeline parameters dict — user-provided +
+            # auto-injected partition_key (when partitioned)
+            adf_params: Dict[str, Any] = dict(pipeline_parameters or {})
+            if context.has_partition_key:
+                pkey = context.partition_key
+                pname = partition_parameter_name or "partition_key"
+                adf_params.setdefault(pname, pkey)
+                context.log.info(
+                    f"partitioned run: passing {pname}={pkey} to ADF"
+                )
 
-                            if status in ("Succeeded", "Failed", "Cancelled"):
-                                duration_seconds = 0.0
-                                if pipeline_run.run_end and pipeline_run.run_start:
-                                    duration_seconds = (
-                                        pipeline_run.run_end - pipeline_run.run_start
-                                    ).total_seconds()
+            for p_name, key_paths in pipelines_to_run.items():
+                create_kwargs: Dict[str, Any] = {}
+                if adf_params:
+                    create_kwargs["parameters"] = adf_params
+                run_response = adf_client.pipelines.create_run(
+                    resource_group_name,
+                    factory_name,
+                    p_name,
+                    **create_kwargs,
+                )
+                run_id = run_response.run_id
+                monitor_url = _monitor_url(run_id)
+                context.log.info(f"ADF pipeline run started. Run ID: {run_id}")
+                context.log.info(f"Monitor: {monitor_url}")
+
+                if not wait_for_completion:
+                    # Fire-and-forget — yield immediately
+                    for key_path in key_paths:
+                        yield dg.MaterializeResult(
+                            asset_key=dg.AssetKey(list(key_path)),
+                            metadata={
+                                "run_id": dg.MetadataValue.text(run_id),
+                                "status": dg.MetadataValue.text("Submitted"),
+                                "pipeline_name": pipeline_name_value,
+                                "monitor_url": dg.MetadataValue.url(monitor_url),
+                                "parameters": dg.MetadataValue.json(adf_params),
+                            },
+                        )
+                    continue
 
-                                run_metadata: Dict[str, Any] = {
-                                    "run_id": dg.MetadataValue.text(run_id),
-                                    "status": dg.MetadataValue.text(status),
-                                    "pipeline_name": dg.MetadataValue.text(p_name),
-                                    "start_time": dg.MetadataValue.text(str(pipeline_run.run_start)),
-                                    "end_time": dg.MetadataValue.text(str(pipeline_run.run_end)),
-                                    "duration_seconds": dg.MetadataValue.float(duration_seconds),
-                                    "monitor_url": dg.MetadataValue.url(monitor_url),
-                                    "parameters": dg.MetadataValue.json(adf_params),
-                                }
-
-                                # Per-activity metadata: each activity's status, duration, and any error
-                                if _capture_activity_metadata and pipeline_run.run_start and pipeline_run.run_end:
-                                    try:
-                                        from azure.mgmt.datafactory.models import RunFilterParameters
-                                        activity_runs = adf_client.activity_runs.query_by_pipeline_run(
-                                            _resource_group_name, _factory_name, run_id,
-                                            RunFilterParameters(
-                                                last_updated_after=pipeline_run.run_start,
-                                                last_updated_before=pipeline_run.run_end,
-                                            ),
-                                        )
-                                        activities_summary = []
-                                        for ar in (activity_runs.value or []):
-                                            ar_dur = 0.0
-                                            if ar.activity_run_end and ar.activity_run_start:
-                                                ar_dur = (ar.activity_run_end - ar.activity_run_start).total_seconds()
-                                            activities_summary.append({
-                                                "name": ar.activity_name,
-                                                "type": ar.activity_type,
-                                                "status": ar.status,
-                                                "duration_seconds": ar_dur,
-                                                "error": (ar.error or {}).get("message") if isinstance(ar.error, dict) else (str(ar.error) if ar.error else None),
-                                                "output_keys": list((ar.output or {}).keys()) if isinstance(ar.output, dict) else None,
-                                            })
-                                            # Stream a per-activity log line so users see them in dg
-                                            context.log.info(
-                                                f"  activity: {ar.activity_name} ({ar.activity_type}) "
-                                                f"status={ar.status} duration={ar_dur:.1f}s"
-                                            )
-                                        run_metadata["activities"] = dg.MetadataValue.json(activities_summary)
-                                        run_metadata["activity_count"] = dg.MetadataValue.int(len(activities_summary))
-                                        failed_activities = [a["name"] for a in activities_summary if a["status"] == "Failed"]
-                                        if failed_activities:
-                                            run_metadata["failed_activities"] = dg.MetadataValue.json(failed_activities)
-                                    except Exception as _exc:
-                                        context.log.warning(f"  could not fetch activity metadata: {_exc}")
-
-                                if status == "Failed":
-                                    error_msg = getattr(pipeline_run, "message", None) or "Pipeline failed"
-                                    run_metadata["error"] = dg.MetadataValue.text(error_msg)
-                                    # Yield the materialization with status before raising — so the
-                                    # failure metadata is recorded in the catalog, not lost.
-                                    for key_path in key_paths:
-                                        yield dg.MaterializeResult(
-                                            asset_key=dg.AssetKey(list(key_path)),
-                                            metadata={**run_metadata, "outcome": dg.MetadataValue.text("failed")},
-                                        )
-                                    raise Exception(
-                                        f"ADF pipeline '{p_name}' failed: {error_msg} (run_id={run_id})"
+                # Poll quickly at first so short pipelines are picked up within
+                # seconds, then back off to the configured interval. Runs awaited
+                # concurrently in this process share their status queries.
+                run_statuses = _get_run_status_batcher(adf_client, resource_group_name, factory_name)
+                run_statuses.register(run_id, p_name)
+                poll_waits = _run_poll_waits(run_poll_interval_seconds)
+                started = last_polled = time.monotonic()
+                deadline = started + max_wait_seconds
+                try:
+                    pipeline_run = None
+                    while time.monotonic() < deadline:
+                        pipeline_run, retry_after = run_statuses.get(run_id, newer_than=last_polled)
+                        last_polled = time.monotonic()
+                        status = pipeline_run.status
+                        elapsed = time.monotonic() - started
+                        context.log.info(f"  poll: {p_name} status={status} elapsed={elapsed:.0f}s")
+
+                        if status in _TERMINAL_RUN_STATUSES:
+                            run_start, run_end = pipeline_run.run_start, pipeline_run.run_end
+                            run_metadata = {
+                                **_build_run_metadata(pipeline_run, pipeline_name_value),
+                                "monitor_url": dg.MetadataValue.url(monitor_url),
+                                "parameters": dg.MetadataValue.json(adf_params),
+                            }
+
+                            # Per-activity metadata: each activity's status, duration, and any error
+                            if capture_activity_metadata and run_start and run_end:
+                                try:
+                                    from azure.mgmt.datafactory.models import RunFilterParameters
+                                    query_activity_runs = adf_client.activity_runs.query_by_pipeline_run
+                                    activity_query_args = (
+                                        resource_group_name, factory_name, run_id,
+                                        RunFilterParameters(
+                                            last_updated_after=run_start,
+                                            last_updated_before=run_end,
+                                        ),
                                     )
-
+                                    activities_summary = []
+                                    for ar in _iter_query_runs(
+                                        query_activity_runs,
+                                        query_activity_runs(*activity_query_args),
+                                        *activity_query_args,
+                                    ):
+                                        ar_start, ar_end = ar.activity_run_start, ar.activity_run_end
+                                        ar_dur = (ar_end - ar_start).total_seconds() if ar_start and ar_end else 0.0
+                                        activities_summary.append({
+                                            "name": ar.activity_name,
+                                            "type": ar.activity_type,
+                                            "status": ar.status,
+                                            "duration_seconds": ar_dur,
+                                            "error": (ar.error or {}).get("message") if isinstance(ar.error, dict) else (str(ar.error) if ar.error else None),
+                                            "output_keys": list((ar.output or {}).keys()) if isinstance(ar.output, dict) else None,
+                                        })
+                                        # Stream a per-activity log line so users see them in dg
+                                        context.log.info(
+                                            f"  activity: {ar.activity_name} ({ar.activity_type}) "
+                                            f"status={ar.status} duration={ar_dur:.1f}s"
+                                        )
+                                    run_metadata["activities"] = dg.MetadataValue.json(activities_summary)
+                                    run_metadata["activity_count"] = dg.MetadataValue.int(len(activities_summary))
+                                    failed_activities = [a["name"] for a in activities_summary if a["status"] == "Failed"]
+                                    if failed_activities:
+                                        run_metadata["failed_activities"] = dg.MetadataValue.json(failed_activities)
+                                except Exception as _exc:
+                                    context.log.warning(f"  could not fetch activity metadata: {_exc}")
+
+                            if status == "Failed":
+                                error_msg = getattr(pipeline_run, "message", None) or "Pipeline failed"
+                                run_metadata["error"] = dg.MetadataValue.text(error_msg)
+                                # Yield the materialization with status before raising — so the
+                                # failure metadata is recorded in the catalog, not lost.
                                 for key_path in key_paths:
                                     yield dg.MaterializeResult(
                                         asset_key=dg.AssetKey(list(key_path)),
-                                        metadata=run_metadata,
+                                        metadata={**run_metadata, "outcome": dg.MetadataValue.text("failed")},
                                     )
-                                break
-
-                            time.sleep(_poll_interval)
-                            elapsed += _poll_interval
+                                raise Exception(
+                                    f"ADF pipeline '{p_name}' failed: {error_msg} (run_id={run_id})"
+                                )
 
-                        else:
-                            context.log.warning(
-                                f"ADF pipeline run timed out after {_max_wait_seconds}s"
-                            )
                             for key_path in key_paths:
                                 yield dg.MaterializeResult(
                                     asset_key=dg.AssetKey(list(key_path)),
-                                    metadata={
-                                        "run_id": dg.MetadataValue.text(run_id),
-                                        "status": dg.MetadataValue.text("Timeout"),
-                                        "pipeline_name": dg.MetadataValue.text(p_name),
-                                        "monitor_url": dg.MetadataValue.url(monitor_url),
-                                        "max_wait_seconds": dg.MetadataValue.int(_max_wait_seconds),
-                                    },
+                                    metadata=run_metadata,
                                 )
+                            break
 
-                return pipeline_multi_asset
+                        # Wait at least as long as ADF asks to, but not past the deadline
+                        wait = max(next(poll_waits), retry_after)
+                        time.sleep(min(wait, max(deadline - time.monotonic(), 0)))
 
-            assets.append(_make_pipeline_asset())
+                    else:
+                        context.log.warning(
+                            f"ADF pipeline run timed out after {max_wait_seconds}s"
+                        )
+                        for key_path in key_paths:
+                            yield dg.MaterializeResult(
+                                asset_key=dg.AssetKey(list(key_path)),
+                                metadata={
+                                    "run_id": dg.MetadataValue.text(run_id),
+                                    "status": dg.MetadataValue.text("Timeout"),
+                                    "pipeline_name": pipeline_name_value,
+                                    "monitor_url": dg.MetadataValue.url(monitor_url),
+                                    "max_wait_seconds": dg.MetadataValue.int(max_wait_seconds),
+                                },
+                            )
+                finally:
+                    run_statuses.unregister(run_id)
 
-    # ── Trigger assets ─────────────────────────────────────────────────────────
-    if import_triggers:
-        for trigger_name in trigger_names:
+        return pipeline_multi_asset
 
-            @dg.asset(retry_policy=_retry_policy,
-                name=f"adf_trigger_{trigger_name}",
+    if import_pipelines:
+        pipelines = _dedupe_by_name(pipelines)
+        _pipeline_op_names = _unique_op_names("adf_pipeline_", (p["name"] for p in pipelines))
+        _pipeline_by_key: Dict[dg.AssetKey, str] = {}
+        assets.extend(_build_pipeline_asset(pipeline_meta) for pipeline_meta in pipelines)
+
+    # ── Trigger assets ─────────────────────────────────────────────────────────
+    def _build_trigger_asset(trigger_meta: Dict[str, Any]) -> dg.AssetsDefinition:
+        trigger_name = trigger_meta["name"]
+        trigger_name_value = dg.MetadataValue.text(trigger_name)
+        trigger_type_value = dg.MetadataValue.text(trigger_meta.get("type") or "Unknown")
+
+        # The key comes from the trigger name itself; the deduplicated op name
+        # depends on listing order, so it must not shape asset identity.
+        @dg.multi_asset(
+            specs=[dg.AssetSpec(
+                key=dg.AssetKey([f"adf_trigger_{trigger_name}"]),
                 group_name=group_name,
                 description=f"ADF trigger: {trigger_name}",
                 metadata={
-                    "trigger_name": dg.MetadataValue.text(trigger_name),
-                    "factory_name": dg.MetadataValue.text(factory_name),
-                    "resource_group": dg.MetadataValue.text(resource_group_name),
+                    "trigger_name": trigger_name_value,
+                    "trigger_type": trigger_type_value,
+                    **_metadata_base,
                 },
                 kinds={"azure", "adf"},
-            )
-            def trigger_asset(
-                context: dg.AssetExecutionContext,
-                _trigger_name: str = trigger_name,
-                _subscription_id: str = subscription_id,
-                _resource_group_name: str = resource_group_name,
-                _factory_name: str = factory_name,
-                _tenant_id: Optional[str] = tenant_id,
-                _client_id: Optional[str] = client_id,
-                _client_secret: Optional[str] = client_secret,
-            ):
-                """Start an Azure Data Factory trigger (no-op if already running)."""
-                adf_client = _get_adf_client(
-                    _subscription_id, _tenant_id, _client_id, _client_secret
-                )
-
-                trigger = adf_client.triggers.get(
-                    _resource_group_name,
-                    _factory_name,
-                    _trigger_name,
+            )],
+            name=_trigger_op_names[trigger_name],
+            retry_policy=_retry_policy,
+        )
+        def trigger_asset(context: dg.AssetExecutionContext):
+            """Start an Azure Data Factory trigger (no-op if already running)."""
+            from azure.core.exceptions import HttpResponseError
+
+            adf_client = _adf_client()
+
+            # Start optimistically instead of reading the runtime state first;
+            # starting a running trigger is harmless or rejected as such.
+            try:
+                # Starting a trigger usually completes in about a second; poll the
+                # LRO every 2s instead of the SDK's 30s default.
+                poller = adf_client.triggers.begin_start(
+                    resource_group_name,
+                    factory_name,
+                    trigger_name,
+                    polling_interval=2,
                 )
-                runtime_state = getattr(trigger, "runtime_state", "Unknown")
-                context.log.info(f"Trigger runtime state: {runtime_state}")
-
-                if runtime_state != "Started":
-                    adf_client.triggers.begin_start(
-                        _resource_group_name,
-                        _factory_name,
-                        _trigger_name,
-                    ).result()
-                    context.log.info(f"Trigger {_trigger_name} started")
+                if wait_for_completion:
+                    poller.result()
+            except HttpResponseError as exc:
+                if "already" not in str(exc).lower():
+                    raise
+                context.log.info(f"Trigger {trigger_name} already running")
+                runtime_state = "Started"
+            else:
+                if wait_for_completion:
+                    context.log.info(f"Trigger {trigger_name} started")
+                    runtime_state = "Started"
                 else:
-                    context.log.info(f"Trigger {_trigger_name} already running")
-
-                return dg.MaterializeResult(
-                    metadata={
-                        "trigger_name": dg.MetadataValue.text(_trigger_name),
-                        "runtime_state": dg.MetadataValue.text("Started"),
-                        "trigger_type": dg.MetadataValue.text(
-                            getattr(trigger, "type", "Unknown") or "Unknown"
-                        ),
-                    }
-                )
+                    # Fire-and-forget — the start request has been accepted
+                    context.log.info(f"Trigger {trigger_name} start submitted")
+                    runtime_state = "Starting"
+
+            return dg.MaterializeResult(
+                metadata={
+                    "trigger_name": trigger_name_value,
+                    "runtime_state": dg.MetadataValue.text(runtime_state),
+                    "trigger_type": trigger_type_value,
+                }
+            )
 
-            assets.append(trigger_asset)
+        return trigger_asset
+
+    if import_triggers:
+        triggers = _dedupe_by_name(triggers)
+        _trigger_op_names = _unique_op_names("adf_trigger_", (t["name"] for t in triggers))
+        assets.extend(_build_trigger_asset(trigger_meta) for trigger_meta in triggers)
 
     # ── Observation sensor ─────────────────────────────────────────────────────
     if generate_sensor and (import_pipelines or import_triggers):
+        _sensor_filters = _NameFilters.compile(filter_by_name_pattern, exclude_name_pattern)
+        _sensor_pipeline_names = _sensor_filters.exact_names()
+        # The set of pipeline names is small and stable, so filter results are
+        # kept across ticks rather than re-running the regexes for every run.
+        _sensor_name_matches = functools.lru_cache(maxsize=1024)(_sensor_filters.matches)
 
         @dg.sensor(
             name=f"{group_name}_observation_sensor",
@@ -600,71 +1059,114 @@ def _build_adf_defs(
         )
         def adf_observation_sensor(context: dg.SensorEvaluationContext):
             """Observe Azure Data Factory pipeline runs and trigger runs."""
-            from azure.mgmt.datafactory.models import RunFilterParameters
+            from azure.mgmt.datafactory.models import (
+                RunFilterParameters,
+                RunQueryFilter,
+                RunQueryFilterOperand,
+                RunQueryFilterOperator,
+            )
 
-            adf_client = _get_adf_client(subscription_id, tenant_id, client_id, client_secret)
+            adf_client = _adf_client()
 
+            # Cursor: epoch seconds of the last check. Older cursors stored a
+            # naive-UTC ISO timestamp; accept those once.
             cursor = context.cursor
-            last_check = (
-                datetime.fromisoformat(cursor)
-                if cursor
-                else datetime.utcnow() - timedelta(hours=1)
+            now_ts = int(time.time())
+            if cursor and cursor.isdigit():
+                last_check_ts = int(cursor)
+            elif cursor:
+                last_check_ts = int(
+                    datetime.fromisoformat(cursor).replace(tzinfo=timezone.utc).timestamp()
+                )
+            else:
+                last_check_ts = now_ts - 3600
+            last_check = datetime.fromtimestamp(last_check_ts, tz=timezone.utc)
+            now = datetime.fromtimestamp(now_ts, tz=timezone.utc)
+
+            # Only finished runs of matching pipelines are used, so let ADF drop
+            # the rest; the client-side checks below still apply.
+            pipeline_run_filters = [
+                RunQueryFilter(
+                    operand=RunQueryFilterOperand.STATUS,
+                    operator=RunQueryFilterOperator.IN,
+                    values=sorted(_TERMINAL_RUN_STATUSES),
+                )
+            ]
+            if _sensor_pipeline_names:
+                pipeline_run_filters.append(
+                    RunQueryFilter(
+                        operand=RunQueryFilterOperand.PIPELINE_NAME,
+                        operator=RunQueryFilterOperator.IN,
+                        values=_sensor_pipeline_names,
+                    )
+                )
+            pipeline_filter_params = RunFilterParameters(
+                last_updated_after=last_check,
+                last_updated_before=now,
+                filters=pipeline_run_filters,
             )
-            now = datetime.utcnow()
-
-            filter_params = RunFilterParameters(
+            trigger_filter_params = RunFilterParameters(
                 last_updated_after=last_check,
                 last_updated_before=now,
+                filters=[
+                    RunQueryFilter(
+                        operand=RunQueryFilterOperand.STATUS,
+                        operator=RunQueryFilterOperator.IN,
+                        values=sorted(_LOGGED_TRIGGER_RUN_STATUSES),
+                    )
+                ],
             )
 
-            pipeline_runs = adf_client.pipeline_runs.query_by_factory(
-                resource_group_name, factory_name, filter_params
+            # The two run queries are independent, so fetch their first pages
+            # together; later pages are streamed as the runs are processed.
+            query_pipeline_runs = adf_client.pipeline_runs.query_by_factory
+            query_trigger_runs = adf_client.trigger_runs.query_by_factory
+            pipeline_query_args = (resource_group_name, factory_name, pipeline_filter_params)
+            trigger_query_args = (resource_group_name, factory_name, trigger_filter_params)
+            pipeline_runs_future = _SENSOR_QUERY_POOL.submit(query_pipeline_runs, *pipeline_query_args)
+            trigger_runs_future = _SENSOR_QUERY_POOL.submit(query_trigger_runs, *trigger_query_args)
+            pipeline_runs = _iter_query_runs(
+                query_pipeline_runs, pipeline_runs_future.result(), *pipeline_query_args
+            )
+            trigger_runs = _iter_query_runs(
+                query_trigger_runs, trigger_runs_future.result(), *trigger_query_args
             )
 
-            for run in pipeline_runs.value:
-                if run.status not in ("Succeeded", "Failed", "Cancelled"):
+            # Runs repeat the same few pipeline names, so reuse their asset key
+            # and metadata value within a tick; False marks a name the filters
+            # reject.
+            text = dg.MetadataValue.text
+            pipeline_run_targets: Dict[str, Any] = {}
+
+            for run in pipeline_runs:
+                if run.status not in _TERMINAL_RUN_STATUSES:
                     continue
                 run_pipeline_name = run.pipeline_name or ""
-                if not _matches_filters(
-                    run_pipeline_name,
-                    filter_by_name_pattern,
-                    exclude_name_pattern,
-                    None,
-                ):
+                target = pipeline_run_targets.get(run_pipeline_name)
+                if target is None:
+                    target = pipeline_run_targets[run_pipeline_name] = (
+                        (dg.AssetKey(f"adf_pipeline_{run_pipeline_name}"), text(run_pipeline_name))
+                        if not _sensor_filters.active or _sensor_name_matches(run_pipeline_name)
+                        else False
+                    )
+                if target is False:
                     continue
-
-                duration = 0.0
-                if run.run_end and run.run_start:
-                    duration = (run.run_end - run.run_start).total_seconds()
-
-                meta: Dict[str, Any] = {
-                    "run_id": dg.MetadataValue.text(run.run_id or ""),
-                    "status": dg.MetadataValue.text(run.status),
-                    "pipeline_name": dg.MetadataValue.text(run_pipeline_name),
-                    "start_time": dg.MetadataValue.text(str(run.run_start)),
-                    "end_time": dg.MetadataValue.text(str(run.run_end)),
-                    "duration_seconds": dg.MetadataValue.float(duration),
-                }
-                if run.status == "Failed" and getattr(run, "message", None):
-                    meta["error"] = dg.MetadataValue.text(run.message)
+                asset_key, pipeline_name_value = target
 
                 yield dg.AssetMaterialization(
-                    asset_key=f"adf_pipeline_{run_pipeline_name}",
-                    metadata=meta,
+                    asset_key=asset_key,
+                    metadata=_build_run_metadata(run, pipeline_name_value),
                 )
 
             # Log trigger run activity
-            trigger_runs = adf_client.trigger_runs.query_by_factory(
-                resource_group_name, factory_name, filter_params
-            )
-            for run in trigger_runs.value:
-                if run.status in ("Succeeded", "Failed"):
+            for run in trigger_runs:
+                if run.status in _LOGGED_TRIGGER_RUN_STATUSES:
                     context.log.info(
                         f"Trigger run: {run.trigger_name} — Status: {run.status} — "
                         f"Time: {run.trigger_run_timestamp}"
                     )
 
-            context.update_cursor(now.isoformat())
+            context.update_cursor(str(now_ts))
 
         sensors.append(adf_observation_sensor)
 
@@ -792,31 +1294,17 @@ if _HAS_STATE_BACKED:
                 _sec,
             )
 
-            state: Dict[str, Any] = {}
-
-            if self.import_pipelines:
-                state["pipelines"] = _fetch_pipelines(
-                    client,
-                    self.resource_group_name,
-                    self.factory_name,
-                    self.filter_by_name_pattern,
-                    self.exclude_name_pattern,
-                    self.filter_by_tags,
-                )
-            else:
-                state["pipelines"] = []
-
-            if self.import_triggers:
-                state["triggers"] = _fetch_triggers(
-                    client,
-                    self.resource_group_name,
-                    self.factory_name,
-                    self.filter_by_name_pattern,
-                    self.exclude_name_pattern,
-                    self.filter_by_tags,
-                )
-            else:
-                state["triggers"] = []
+            pipelines, triggers = _fetch_catalog(
+                client,
+                self.resource_group_name,
+                self.factory_name,
+                self.import_pipelines,
+                self.import_triggers,
+                self.filter_by_name_pattern,
+                self.exclude_name_pattern,
+                self.filter_by_tags,
+            )
+            state: Dict[str, Any] = {"pipelines": pipelines, "triggers": triggers}
 
             state_path.write_text(json.dumps(state, indent=2))
 
@@ -836,11 +1324,14 @@ if _HAS_STATE_BACKED:
 
             state = json.loads(state_path.read_text())
             pipelines: List[Dict[str, Any]] = state.get("pipelines", [])
-            trigger_names: List[str] = state.get("triggers", [])
+            # Older caches stored bare trigger names
+            triggers: List[Dict[str, Any]] = [
+                t if isinstance(t, dict) else {"name": t} for t in state.get("triggers", [])
+            ]
 
             return _build_adf_defs(
                 pipelines=pipelines,
-                trigger_names=trigger_names,
+                triggers=triggers,
                 subscription_id=self.subscription_id,
                 resource_group_name=self.resource_group_name,
                 factory_name=self.factory_name,
@@ -924,7 +1415,7 @@ else:
             default=None, description="Regex to exclude entities by name"
         )
         filter_by_tags: Optional[str] = Field(
-            default=None, description="Comma-separated tag keys to filter entities"
+            default=None, description="Comma-separated tag keys to filter entities (matched against ADF annotations)"
         )
 
         generate_sensor: bool = Field(default=True, description="Generate observation sensor")
@@ -967,7 +1458,10 @@ else:
         )
         run_poll_interval_seconds: int = Field(
             default=30,
-            description="Seconds between status polls while a run is in progress.",
+            description=(
+                "Maximum seconds between status polls while a run is in progress. "
+                "Polling starts at 1s and backs off to this interval."
+            ),
         )
         wait_for_completion: bool = Field(
             default=True,
@@ -1021,32 +1515,21 @@ else:
                 _sec,
             )
 
-            pipelines: List[Dict[str, Any]] = []
-            trigger_names: List[str] = []
-
-            if self.import_pipelines:
-                pipelines = _fetch_pipelines(
-                    client,
-                    self.resource_group_name,
-                    self.factory_name,
-                    self.filter_by_name_pattern,
-                    self.exclude_name_pattern,
-                    self.filter_by_tags,
-                )
-
-            if self.import_triggers:
-                trigger_names = _fetch_triggers(
-                    client,
-                    self.resource_group_name,
-                    self.factory_name,
-                    self.filter_by_name_pattern,
-                    self.exclude_name_pattern,
-                    self.filter_by_tags,
-                )
+            pipelines, triggers = _fetch_catalog_cached(
+                client,
+                self.subscription_id,
+                self.resource_group_name,
+                self.factory_name,
+                self.import_pipelines,
+                self.import_triggers,
+                self.filter_by_name_pattern,
+                self.exclude_name_pattern,
+                self.filter_by_tags,
+            )
 
             return _build_adf_defs(
                 pipelines=pipelines,
-                trigger_names=trigger_names,
+                triggers=triggers,
                 subscription_id=self.subscription_id,
                 resource_group_name=self.resource_group_name,
                 factory_name=self.factory_name,
@@ -5,9 +5,10 @@ Import Azure Stream Analytics jobs as Dagster assets with automatic observation
 
 from dagster import AssetKey  # auto-added for hierarchical keys
 
+import functools
 import re
 from dataclasses import dataclass
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, FrozenSet, Iterator
 from datetime import datetime, timedelta
 import time
 
@@ -28,7 +29,7 @@ from dagster import (
     Model,
     MetadataValue,
 )
-from pydantic import Field
+from pydantic import Field, PrivateAttr
 
 
 # ─── Asset overrides (inline; kept per-component to preserve self-containment) ─
@@ -57,6 +58,27 @@ def _resolve_override_deps(
     return [AssetKey(d.split("/")) if "/" in d else AssetKey(d) for d in ov.depends_on]
 
 
+# Job states the observation sensor reports as materializations
+_OBSERVED_JOB_STATES = frozenset(("Running", "Degraded"))
+
+# Job state, SKU and provisioning state take a handful of values; share one
+# MetadataValue per value across every sensor tick.
+_small_text_value = functools.lru_cache(maxsize=64)(MetadataValue.text)
+
+# Ramp-up schedule for status polling; capped by the asset's poll interval.
+_POLL_BACKOFF_SECONDS = (1, 2, 5, 10)
+
+
+def _poll_waits(max_interval: int):
+    """Yield sleep durations between polls: a short ramp-up, then *max_interval*."""
+    for wait in _POLL_BACKOFF_SECONDS:
+        if wait >= max_interval:
+            break
+        yield wait
+    while True:
+        yield max_interval
+
+
 class AzureStreamAnalyticsComponent(Component, Model, Resolvable):
     """Component for importing Azure Stream Analytics entities as Dagster assets.
 
@@ -151,51 +173,84 @@ class AzureStreamAnalyticsComponent(Component, Model, Resolvable):
         ),
     )
 
+    _filter_re: Optional[re.Pattern] = PrivateAttr(default=None)
+    _exclude_re: Optional[re.Pattern] = PrivateAttr(default=None)
+    _required_tag_keys: FrozenSet[str] = PrivateAttr(default=frozenset())
+    _credential: Any = PrivateAttr(default=None)
+    _client: Optional[StreamAnalyticsManagementClient] = PrivateAttr(default=None)
+
+    def model_post_init(self, __context: Any) -> None:
+        """Compile the name filter patterns and parse tag keys once per instance."""
+        self._filter_re = re.compile(self.filter_by_name_pattern) if self.filter_by_name_pattern else None
+        self._exclude_re = re.compile(self.exclude_name_pattern) if self.exclude_name_pattern else None
+        if self.filter_by_tags:
+            self._required_tag_keys = frozenset(k.strip() for k in self.filter_by_tags.split(","))
+
     def _get_credential(self):
-        """Get Azure credential."""
-        if self.tenant_id and self.client_id and self.client_secret:
-            return ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret,
-            )
-        return DefaultAzureCredential()
+        """Return the component's Azure credential, creating it on first use.
+
+        One credential per component keeps a single AAD token cache instead of
+        re-authenticating on every asset run and sensor tick.
+        """
+        if self._credential is None:
+            if self.tenant_id and self.client_id and self.client_secret:
+                self._credential = ClientSecretCredential(
+                    tenant_id=self.tenant_id,
+                    client_id=self.client_id,
+                    client_secret=self.client_secret,
+                )
+            else:
+                self._credential = DefaultAzureCredential()
+        return self._credential
 
     def _get_client(self) -> StreamAnalyticsManagementClient:
-        """Create Stream Analytics management client."""
-        credential = self._get_credential()
-        return StreamAnalyticsManagementClient(credential, self.subscription_id)
+        """Return a cached Stream Analytics management client.
+
+        The client is shared by listing, every asset run and every sensor
+        tick, so its HTTPS connection pool is reused rather than rebuilt.
+        """
+        if self._client is None:
+            self._client = StreamAnalyticsManagementClient(
+                self._get_credential(), self.subscription_id
+            )
+        return self._client
 
     def _matches_filters(self, name: str, tags: Optional[Dict[str, str]] = None) -> bool:
         """Check if entity matches name and tag filters."""
         # Name pattern filter
-        if self.filter_by_name_pattern:
-            if not re.search(self.filter_by_name_pattern, name):
-                return False
+        if self._filter_re is not None and not self._filter_re.search(name):
+            return False
 
         # Exclusion pattern
-        if self.exclude_name_pattern:
-            if re.search(self.exclude_name_pattern, name):
-                return False
+        if self._exclude_re is not None and self._exclude_re.search(name):
+            return False
 
         # Tag filter
-        if self.filter_by_tags and tags:
-            required_keys = [k.strip() for k in self.filter_by_tags.split(",")]
-            if not all(key in tags for key in required_keys):
+        if self._required_tag_keys and tags:
+            if not self._required_tag_keys.issubset(tags):
                 return False
 
         return True
 
+    def _iter_streaming_jobs(self, client: StreamAnalyticsManagementClient) -> Iterator[Any]:
+        """Yield the SDK ``StreamingJob`` for every job matching the filters.
+
+        Listed jobs already carry their state, SKU, provisioning state and last
+        output time, so callers need no per-job ``get``.
+        """
+        for job in client.streaming_jobs.list_by_resource_group(self.resource_group_name):
+            if self._matches_filters(job.name, job.tags):
+                yield job
+
     def _list_streaming_jobs(self, client: StreamAnalyticsManagementClient) -> List[Dict]:
         """List all streaming jobs."""
         jobs = []
-        for job in client.streaming_jobs.list_by_resource_group(self.resource_group_name):
-            if self._matches_filters(job.name, job.tags):
-                jobs.append({
-                    "name": job.name,
-                    "job_state": job.job_state,
-                    "sku": job.sku.name if job.sku else "standard",
-                })
+        for job in self._iter_streaming_jobs(client):
+            jobs.append({
+                "name": job.name,
+                "job_state": job.job_state,
+                "sku": job.sku.name if job.sku else "standard",
+            })
         return jobs
 
     def _get_streaming_job_assets(self, client: StreamAnalyticsManagementClient) -> List:
@@ -208,86 +263,88 @@ class AzureStreamAnalyticsComponent(Component, Model, Resolvable):
             asset_key = f"asa_job_{job_name}"
             override_deps = _resolve_override_deps(self.asset_overrides, asset_key)
 
-            @asset(
-                key=AssetKey.from_user_string(asset_key),
-                deps=override_deps,
-                group_name=self.group_name,
-                metadata={
-                    "job_name": job_name,
-                    "resource_group": self.resource_group_name,
-                },
-            )
-            def streaming_job_asset(
-                context: AssetExecutionContext,
-                job_name=job_name,
-            ):
-                """Start Azure Stream Analytics job."""
-                asa_client = self._get_client()
-
-                # Get current job status
-                job = asa_client.streaming_jobs.get(
-                    self.resource_group_name,
-                    job_name,
+            # Factory binds per-job values; default args on the asset function
+            # itself would be treated by Dagster as asset inputs.
+            def _make_streaming_job_asset(job_name=job_name, asset_key=asset_key, override_deps=override_deps):
+                @asset(
+                    key=AssetKey.from_user_string(asset_key),
+                    deps=override_deps,
+                    group_name=self.group_name,
+                    metadata={
+                        "job_name": job_name,
+                        "resource_group": self.resource_group_name,
+                    },
                 )
+                def streaming_job_asset(context: AssetExecutionContext):
+                    """Start Azure Stream Analytics job."""
+                    asa_client = self._get_client()
 
-                current_state = job.job_state
-                context.log.info(f"Current job state: {current_state}")
-
-                # Start job if not running
-                if current_state in ["Created", "Stopped", "Failed"]:
-                    context.log.info(f"Starting streaming job: {job_name}")
-
-                    # Start the job
-                    asa_client.streaming_jobs.begin_start(
+                    # Get current job status
+                    job = asa_client.streaming_jobs.get(
                         self.resource_group_name,
                         job_name,
-                    ).result()
-
-                    context.log.info(f"Job {job_name} started")
+                    )
 
-                    # Wait for job to reach running state
-                    max_wait = 300  # 5 minutes
-                    elapsed = 0
-                    poll_interval = 15
+                    current_state = job.job_state
+                    context.log.info(f"Current job state: {current_state}")
 
-                    while elapsed < max_wait:
-                        time.sleep(poll_interval)
-                        elapsed += poll_interval
+                    # Start job if not running
+                    if current_state in ["Created", "Stopped", "Failed"]:
+                        context.log.info(f"Starting streaming job: {job_name}")
 
-                        job = asa_client.streaming_jobs.get(
+                        # Start the job
+                        asa_client.streaming_jobs.begin_start(
                             self.resource_group_name,
                             job_name,
-                        )
+                        ).result()
 
-                        state = job.job_state
-                        context.log.info(f"Job state: {state}")
+                        context.log.info(f"Job {job_name} started")
 
-                        if state == "Running":
-                            break
-                        elif state in ["Failed", "Degraded"]:
-                            context.log.warning(f"Job reached state: {state}")
-                            break
+                        # Wait for job to reach running state, checking quickly at
+                        # first and backing off to poll_interval
+                        max_wait = 300  # 5 minutes
+                        poll_interval = 15
+                        poll_waits = _poll_waits(poll_interval)
+                        deadline = time.monotonic() + max_wait
 
-                # Get job metrics
-                job = asa_client.streaming_jobs.get(
-                    self.resource_group_name,
-                    job_name,
-                )
+                        while time.monotonic() < deadline:
+                            time.sleep(next(poll_waits))
 
-                metadata = {
-                    "job_name": job_name,
-                    "job_state": job.job_state,
-                    "sku": job.sku.name if job.sku else "standard",
-                    "compatibility_level": job.compatibility_level,
-                    "provisioning_state": job.provisioning_state,
-                }
+                            job = asa_client.streaming_jobs.get(
+                                self.resource_group_name,
+                                job_name,
+                            )
 
-                if job.last_output_event_time:
-                    metadata["last_output_event_time"] = str(job.last_output_event_time)
+                            state = job.job_state
+                            context.log.info(f"Job state: {state}")
 
-                return metadata
+                            if state == "Running":
+                                break
+                            elif state in ["Failed", "Degraded"]:
+                                context.log.warning(f"Job reached state: {state}")
+                                break
 
-            assets.append(streaming_job_asset)
+                    # Get job metrics
+                    job = asa_client.streaming_jobs.get(
+                        self.resource_group_name,
+                        job_name,
+                    )
+
+                    metadata = {
+                        "job_name": job_name,
+                        "job_state": job.job_state,
+                        "sku": job.sku.name if job.sku else "standard",
+                        "compatibility_level": job.compatibility_level,
+                        "provisioning_state": job.provisioning_state,
+                    }
+
+                    if job.last_output_event_time:
+                        metadata["last_output_event_time"] = str(job.last_output_event_time)
+
+                    return metadata
+                return streaming_job_asset
+
+            assets.append(_make_streaming_job_asset())
 
         return assets
 
@@ -302,27 +359,19 @@ class AzureStreamAnalyticsComponent(Component, Model, Resolvable):
             """Sensor to observe Azure Stream Analytics job status."""
             asa_client = self._get_client()
 
-            # Get all streaming jobs
-            jobs = self._list_streaming_jobs(asa_client)
-
-            for job_info in jobs:
-                job_name = job_info["name"]
-
-                # Get job details
-                job = asa_client.streaming_jobs.get(
-                    self.resource_group_name,
-                    job_name,
-                )
+            # One listing call returns every job with its current state
+            for job in self._iter_streaming_jobs(asa_client):
+                job_name = job.name
 
                 # Emit materialization for running jobs
-                if job.job_state in ["Running", "Degraded"]:
+                if job.job_state in _OBSERVED_JOB_STATES:
                     asset_key = f"asa_job_{job_name}"
 
                     metadata = {
                         "job_name": MetadataValue.text(job_name),
-                        "job_state": MetadataValue.text(job.job_state),
-                        "sku": MetadataValue.text(job.sku.name if job.sku else "standard"),
-                        "provisioning_state": MetadataValue.text(job.provisioning_state),
+                        "job_state": _small_text_value(job.job_state),
+                        "sku": _small_text_value(job.sku.name if job.sku else "standard"),
+                        "provisioning_state": _small_text_value(job.provisioning_state),
                     }
 
                     if job.last_output_event_time:
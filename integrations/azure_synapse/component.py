@@ -8,12 +8,11 @@ from dagster import AssetKey  # auto-added for hierarchical keys
 
 import re
 from dataclasses import dataclass
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, FrozenSet
 from datetime import datetime, timedelta
 import time
 
 from azure.identity import DefaultAzureCredential, ClientSecretCredential
-from azure.mgmt.synapse import SynapseManagementClient
 from azure.synapse.artifacts import ArtifactsClient
 from azure.core.exceptions import ResourceNotFoundError
 
@@ -31,7 +30,7 @@ from dagster import (
     Model,
     MetadataValue,
 )
-from pydantic import Field
+from pydantic import Field, PrivateAttr
 
 
 # ─── Asset overrides (inline; kept per-component to preserve self-containment) ─
@@ -60,6 +59,25 @@ def _resolve_override_deps(
     return [AssetKey(d.split("/")) if "/" in d else AssetKey(d) for d in ov.depends_on]
 
 
+_TERMINAL_RUN_STATUSES = frozenset(("Succeeded", "Failed", "Cancelled"))
+# Shared by every sensor-emitted materialization
+_STATUS_METADATA = {status: MetadataValue.text(status) for status in _TERMINAL_RUN_STATUSES}
+_ZERO_DURATION = MetadataValue.float(0.0)
+
+# Ramp-up schedule for status polling; capped by the asset's poll interval.
+_POLL_BACKOFF_SECONDS = (1, 2, 5, 10)
+
+
+def _poll_waits(max_interval: int):
+    """Yield sleep durations between polls: a short ramp-up, then *max_interval*."""
+    for wait in _POLL_BACKOFF_SECONDS:
+        if wait >= max_interval:
+            break
+        yield wait
+    while True:
+        yield max_interval
+
+
 class AzureSynapseComponent(Component, Model, Resolvable):
     """Component for importing Azure Synapse Analytics entities as Dagster assets.
 
@@ -151,6 +169,14 @@ class AzureSynapseComponent(Component, Model, Resolvable):
         description="Generate observation sensor for pipeline runs"
     )
 
+    wait_for_completion: bool = Field(
+        default=True,
+        description=(
+            "If False, fire-and-forget — return as soon as the pipeline run is "
+            "submitted and leave its outcome to the observation sensor."
+        ),
+    )
+
     group_name: str = Field(
         default="azure_synapse",
         description="Asset group name for all imported assets"
@@ -171,43 +197,61 @@ class AzureSynapseComponent(Component, Model, Resolvable):
         ),
     )
 
+    _filter_re: Optional[re.Pattern] = PrivateAttr(default=None)
+    _exclude_re: Optional[re.Pattern] = PrivateAttr(default=None)
+    _required_tag_keys: FrozenSet[str] = PrivateAttr(default=frozenset())
+    _credential: Any = PrivateAttr(default=None)
+    _artifacts_client: Optional[ArtifactsClient] = PrivateAttr(default=None)
+
+    def model_post_init(self, __context: Any) -> None:
+        """Compile the name filter patterns and parse tag keys once per instance."""
+        self._filter_re = re.compile(self.filter_by_name_pattern) if self.filter_by_name_pattern else None
+        self._exclude_re = re.compile(self.exclude_name_pattern) if self.exclude_name_pattern else None
+        if self.filter_by_tags:
+            self._required_tag_keys = frozenset(k.strip() for k in self.filter_by_tags.split(","))
+
     def _get_credential(self):
-        """Get Azure credential."""
-        if self.tenant_id and self.client_id and self.client_secret:
-            return ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret,
-            )
-        return DefaultAzureCredential()
+        """Return the component's Azure credential, creating it on first use.
 
-    def _get_management_client(self) -> SynapseManagementClient:
-        """Create Synapse management client."""
-        credential = self._get_credential()
-        return SynapseManagementClient(credential, self.subscription_id)
+        The artifacts client is built with it once, so there is one AAD token
+        cache per component instead of a fresh authentication on every asset
+        run and sensor tick.
+        """
+        if self._credential is None:
+            if self.tenant_id and self.client_id and self.client_secret:
+                self._credential = ClientSecretCredential(
+                    tenant_id=self.tenant_id,
+                    client_id=self.client_id,
+                    client_secret=self.client_secret,
+                )
+            else:
+                self._credential = DefaultAzureCredential()
+        return self._credential
 
     def _get_artifacts_client(self) -> ArtifactsClient:
-        """Create Synapse artifacts client."""
-        credential = self._get_credential()
-        endpoint = f"https://{self.workspace_name}.dev.azuresynapse.net"
-        return ArtifactsClient(credential, endpoint)
+        """Return a cached Synapse artifacts client.
+
+        The client is shared by listing, every asset run and every sensor
+        tick, so its HTTPS connection pool is reused rather than rebuilt.
+        """
+        if self._artifacts_client is None:
+            endpoint = f"https://{self.workspace_name}.dev.azuresynapse.net"
+            self._artifacts_client = ArtifactsClient(self._get_credential(), endpoint)
+        return self._artifacts_client
 
     def _matches_filters(self, name: str, tags: Optional[Dict[str, str]] = None) -> bool:
         """Check if entity matches name and tag filters."""
         # Name pattern filter
-        if self.filter_by_name_pattern:
-            if not re.search(self.filter_by_name_pattern, name):
-                return False
+        if self._filter_re is not None and not self._filter_re.search(name):
+            return False
 
         # Exclusion pattern
-        if self.exclude_name_pattern:
-            if re.search(self.exclude_name_pattern, name):
-                return False
+        if self._exclude_re is not None and self._exclude_re.search(name):
+            return False
 
         # Tag filter
-        if self.filter_by_tags and tags:
-            required_keys = [k.strip() for k in self.filter_by_tags.split(",")]
-            if not all(key in tags for key in required_keys):
+        if self._required_tag_keys and tags:
+            if not self._required_tag_keys.issubset(tags):
                 return False
 
         return True
@@ -266,14 +310,21 @@ class AzureSynapseComponent(Component, Model, Resolvable):
                     run_id = run_response.run_id
                     context.log.info(f"Pipeline run started. Run ID: {run_id}")
 
+                    if not component_self.wait_for_completion:
+                        # Fire-and-forget — the observation sensor records the outcome
+                        return {"run_id": run_id, "status": "Submitted", "pipeline_name": _pipeline_name}
+
+                    # Poll quickly at first so short runs finish within seconds,
+                    # then back off to poll_interval
                     max_wait_minutes = 60
                     poll_interval = 30
-                    elapsed = 0
-                    while elapsed < max_wait_minutes * 60:
+                    poll_waits = _poll_waits(poll_interval)
+                    deadline = time.monotonic() + max_wait_minutes * 60
+                    while time.monotonic() < deadline:
                         pipeline_run = artifacts_client.pipeline_run.get_pipeline_run(run_id)
                         status = pipeline_run.status
                         context.log.info(f"Pipeline run status: {status}")
-                        if status in ["Succeeded", "Failed", "Cancelled"]:
+                        if status in _TERMINAL_RUN_STATUSES:
                             metadata = {
                                 "run_id": run_id,
                                 "status": status,
@@ -289,8 +340,7 @@ class AzureSynapseComponent(Component, Model, Resolvable):
                             if status == "Failed":
                                 metadata["error"] = pipeline_run.message or "Pipeline failed"
                             return metadata
-                        time.sleep(poll_interval)
-                        elapsed += poll_interval
+                        time.sleep(next(poll_waits))
 
                     context.log.warning(f"Pipeline run timed out after {max_wait_minutes} minutes")
                     return {"run_id": run_id, "status": "Timeout", "pipeline_name": _pipeline_name}
@@ -464,25 +514,39 @@ class AzureSynapseComponent(Component, Model, Resolvable):
                 }
             )
 
+            # Runs repeat the same few pipelines, so each pipeline's filter result,
+            # asset key and name value are worked out once per tick (False marks
+            # a pipeline the filters reject).
+            pipeline_targets: Dict[str, Any] = {}
+
             # Emit asset materializations for completed pipeline runs
             for run in pipeline_runs.value:
-                if run.status in ["Succeeded", "Failed", "Cancelled"]:
-                    # Check if pipeline matches our filters
-                    if not self._matches_filters(run.pipeline_name):
+                if run.status in _TERMINAL_RUN_STATUSES:
+                    target = pipeline_targets.get(run.pipeline_name)
+                    if target is None:
+                        target = pipeline_targets[run.pipeline_name] = (
+                            (
+                                AssetKey(f"synapse_pipeline_{run.pipeline_name}"),
+                                MetadataValue.text(run.pipeline_name),
+                            )
+                            if self._matches_filters(run.pipeline_name)
+                            else False
+                        )
+                    if target is False:
                         continue
+                    asset_key, pipeline_name_value = target
 
-                    asset_key = f"synapse_pipeline_{run.pipeline_name}"
-
+                    run_start, run_end = run.run_start, run.run_end
                     metadata = {
                         "run_id": MetadataValue.text(run.run_id),
-                        "status": MetadataValue.text(run.status),
-                        "pipeline_name": MetadataValue.text(run.pipeline_name),
-                        "start_time": MetadataValue.text(str(run.run_start)),
-                        "end_time": MetadataValue.text(str(run.run_end)),
-                        "duration_seconds": MetadataValue.float(
-                            (run.run_end - run.run_start).total_seconds()
-                            if run.run_end and run.run_start
-                            else 0
+                        "status": _STATUS_METADATA[run.status],
+                        "pipeline_name": pipeline_name_value,
+                        "start_time": MetadataValue.text(str(run_start)),
+                        "end_time": MetadataValue.text(str(run_end)),
+                        "duration_seconds": (
+                            MetadataValue.float((run_end - run_start).total_seconds())
+                            if run_end and run_start
+                            else _ZERO_DURATION
                         ),
                     }
 
@@ -501,7 +565,6 @@ class AzureSynapseComponent(Component, Model, Resolvable):
 
     def build_defs(self, context: ComponentLoadContext) -> Definitions:
         """Build Dagster definitions for the imported Synapse workspace."""
-        mgmt_client = self._get_management_client()
         artifacts_client = self._get_artifacts_client()
 
         assets = []